@@ -3,8 +3,10 @@
 Central settings for your quantitative analysis engine
 """
 
-from typing import Dict, List
+from functools import lru_cache
+from typing import Dict, List, Tuple
 import os
+import re
 
 # === BRAND DETECTION PATTERNS ===
 BRAND_PATTERNS = {
@@ -37,12 +39,41 @@ BRAND_PATTERNS = {
     ]
 }
 
+# Pre-compiled brand patterns (one alternation per brand, compiled once at import)
+# Avoids re-parsing the raw pattern strings on every search call
+BRAND_RE = {
+    brand: re.compile('|'.join(patterns), re.IGNORECASE)
+    for brand, patterns in BRAND_PATTERNS.items()
+}
+
+# Single compiled regex for "any brand name in title" checks (non-capturing
+# group: pandas str.contains warns about patterns with match groups)
+_TITLE_BRAND_RE = re.compile(r'\b(?:' + '|'.join(BRAND_PATTERNS) + r')\b', re.IGNORECASE)
+
+# Compiled keyword alternations for engagement scoring (one C-level pass each
+# instead of a Python loop of substring scans per keyword)
+_REVIEW_KEYWORDS = r'review|rating|star'
+_COMPARE_KEYWORDS = r'vs|versus|comparison|compare'
+_REVIEW_RE = re.compile(_REVIEW_KEYWORDS, re.IGNORECASE)
+_COMPARE_RE = re.compile(_COMPARE_KEYWORDS, re.IGNORECASE)
+
+# Both content categories fused into one multi-pattern scan; named groups tell
+# us which category hit so a single pass can set both bonuses
+_CONTENT_KW_RE = re.compile(
+    r'(?P<review>' + _REVIEW_KEYWORDS + r')|(?P<compare>' + _COMPARE_KEYWORDS + r')',
+    re.IGNORECASE
+)
+
 # === SEARCH CONFIGURATION ===
 SEARCH_CONFIG = {
     'target_results_per_query': 17,  # ~50 total across 3 queries
     'search_delay_range': (2, 4),   # Random delay between searches
     'max_retries': 3,
-    'timeout_seconds': 30
+    'timeout_seconds': 30,
+    # Simulate char-by-char typing on the homepage. Off by default: direct
+    # navigation to the results URL saves ~10s per query; re-enable if
+    # bot detection becomes an issue
+    'human_like_typing': False
 }
 
 # === SoV CALCULATION WEIGHTS ===
@@ -61,6 +92,14 @@ ENGAGEMENT_FACTORS = {
     'comparison_keyword_bonus': 75        # Comparison content = decision-making
 }
 
+# Scoring constants bound once at import so the per-call numeric kernel is
+# plain local arithmetic with no dict lookups
+_LEN_MULT = ENGAGEMENT_FACTORS['content_length_multiplier']
+_TITLE_BONUS = ENGAGEMENT_FACTORS['title_mention_bonus']
+_AUTH_BONUS = ENGAGEMENT_FACTORS['authority_domain_bonus']
+_REVIEW_BONUS = ENGAGEMENT_FACTORS['review_keyword_bonus']
+_COMPARE_BONUS = ENGAGEMENT_FACTORS['comparison_keyword_bonus']
+
 # === KEYWORD CATEGORIES ===
 PRODUCT_KEYWORDS = {
     'core_product': ['smart fan', 'ceiling fan', 'bldc fan', 'energy efficient fan'],
@@ -69,6 +108,11 @@ PRODUCT_KEYWORDS = {
     'comparison': ['vs', 'versus', 'comparison', 'best', 'review']
 }
 
+# Flattened, frozen keyword list (built once instead of per scoring call)
+ALL_PRODUCT_KEYWORDS = tuple(
+    keyword for keywords in PRODUCT_KEYWORDS.values() for keyword in keywords
+)
+
 # === AUTHORITY DOMAINS (Higher Credibility) ===
 AUTHORITY_DOMAINS = [
     'amazon.com', 'flipkart.com', 'croma.com',
@@ -78,6 +122,10 @@ AUTHORITY_DOMAINS = [
     '.edu', '.gov'
 ]
 
+# Compiled authority-domain alternation (single automaton pass over the URL,
+# O(len(url)) regardless of how many authority domains are configured)
+_AUTH_RE = re.compile('|'.join(re.escape(domain) for domain in AUTHORITY_DOMAINS))
+
 # === MONGODB CONFIGURATION ===
 MONGODB_CONFIG = {
     'host': 'localhost',
@@ -93,45 +141,94 @@ QUERY_TEMPLATES = [
     "{product} best brand India"
 ]
 
-def get_search_queries(base_query: str) -> List[str]:
-    """Generate search query variations"""
-    return [template.format(product=base_query) for template in QUERY_TEMPLATES]
+@lru_cache(maxsize=None)
+def get_search_queries(base_query: str) -> Tuple[str, ...]:
+    """Generate search query variations (cached - templates are static)"""
+    return tuple(template.format(product=base_query) for template in QUERY_TEMPLATES)
+
+# Memoized engagement scores keyed by (url, content hash) — the same URL is
+# often re-scored across platforms and repeated queries
+_score_cache: Dict[tuple, float] = {}
+_SCORE_CACHE_MAX = 8192
 
-def get_engagement_score(content: str, url: str, title: str) -> float:
+def get_engagement_score(content: str, url: str, title: str,
+                         _title_search=_TITLE_BRAND_RE.search,
+                         _auth_search=_AUTH_RE.search,
+                         _kw_finditer=_CONTENT_KW_RE.finditer) -> float:
     """
     Calculate engagement score using quantitative factors only
+    Results are cached per (url, content, title) since the score is pure
+    The _-prefixed defaults bind the compiled matchers as locals at
+    definition time; callers should not pass them
     """
+    cache_key = (url, hash(content), title)
+    cached_score = _score_cache.get(cache_key)
+    if cached_score is not None:
+        return cached_score
+
     score = 0.0
-    content_lower = content.lower()
-    
+
     # Content length factor
-    score += len(content) * ENGAGEMENT_FACTORS['content_length_multiplier']
-    
+    score += len(content) * _LEN_MULT
+
     # Title mention bonus
-    if any(brand in title.lower() for brand in BRAND_PATTERNS.keys()):
-        score += ENGAGEMENT_FACTORS['title_mention_bonus']
-    
+    if _title_search(title):
+        score += _TITLE_BONUS
+
     # Authority domain bonus
-    if any(domain in url for domain in AUTHORITY_DOMAINS):
-        score += ENGAGEMENT_FACTORS['authority_domain_bonus']
-    
-    # Content type bonuses
-    if any(keyword in content_lower for keyword in ['review', 'rating', 'star']):
-        score += ENGAGEMENT_FACTORS['review_keyword_bonus']
-    
-    if any(keyword in content_lower for keyword in ['vs', 'versus', 'comparison', 'compare']):
-        score += ENGAGEMENT_FACTORS['comparison_keyword_bonus']
-    
+    if _auth_search(url):
+        score += _AUTH_BONUS
+
+    # Content type bonuses (single fused scan over the content for both
+    # keyword categories)
+    review_hit = False
+    compare_hit = False
+    for match in _kw_finditer(content):
+        if match.lastgroup == 'review':
+            review_hit = True
+        else:
+            compare_hit = True
+        if review_hit and compare_hit:
+            break
+
+    if review_hit:
+        score += _REVIEW_BONUS
+    if compare_hit:
+        score += _COMPARE_BONUS
+
+    if len(_score_cache) >= _SCORE_CACHE_MAX:
+        _score_cache.clear()
+    _score_cache[cache_key] = score
     return score
 
+def score_batch(contents: List[str], urls: List[str], titles: List[str]) -> List[float]:
+    """
+    Vectorized engagement scoring for a whole result batch
+    Same factors as get_engagement_score, computed via pandas C-level kernels
+    """
+    import pandas as pd
+
+    contents = pd.Series(contents, dtype=str)
+    urls = pd.Series(urls, dtype=str)
+    titles = pd.Series(titles, dtype=str)
+
+    score = contents.str.len() * _LEN_MULT
+    score += titles.str.contains(_TITLE_BRAND_RE, regex=True) * _TITLE_BONUS
+    score += urls.str.contains(_AUTH_RE, regex=True) * _AUTH_BONUS
+    score += contents.str.contains(_REVIEW_RE, regex=True) * _REVIEW_BONUS
+    score += contents.str.contains(_COMPARE_RE, regex=True) * _COMPARE_BONUS
+
+    return score.tolist()
+
 # === CHROME DRIVER CONFIGURATION ===
-CHROME_OPTIONS = [
+# Frozen tuple, deduplicated at construction (order-preserving)
+CHROME_OPTIONS = tuple(dict.fromkeys([
     '--headless',
-    '--no-sandbox', 
+    '--no-sandbox',
     '--disable-dev-shm-usage',
     '--disable-gpu',
     '--window-size=1920,1080',
     '--user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
-]
+]))
 
 print("⚙️ Configuration loaded: Quantitative SoV Analysis Ready!")
@@ -5,14 +5,14 @@ Backward compatible with existing Google-only functionality
 """
 
 import sys
-import argparse
-from src.core.detective_coordinator import run_multiplatform_investigation
 
 def parse_arguments():
     """
     📋 Parse command line arguments for platform selection
     """
-    
+
+    import argparse
+
     parser = argparse.ArgumentParser(
         description="Atomberg Share of Voice Detective Agency - Multi-Platform Intelligence",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -59,11 +59,24 @@ def main():
     🎯 Enhanced Main Application Entry Point with Multi-Platform Support
     """
     
-    # Parse command line arguments
-    args = parse_arguments()
-    
+    # Fast path: no flags means the default Google-only investigation, so skip
+    # building the full argparse parser entirely (single-dash flags like -h
+    # must still reach argparse)
+    argv = sys.argv[1:]
+    if not any(arg.startswith("-") for arg in argv):
+        query = " ".join(argv) if argv else "smart fan"
+        platforms_arg = "google"
+        focus_brand = "atomberg"
+        verbose = False
+    else:
+        args = parse_arguments()
+        query = args.query
+        platforms_arg = args.platforms
+        focus_brand = args.focus_brand
+        verbose = args.verbose
+
     # Process platforms
-    platforms = [p.strip() for p in args.platforms.split(",")]
+    platforms = [p.strip() for p in platforms_arg.split(",")]
     
     # Display welcome message
     print("🏢 Welcome to Atomberg SoV Detective Agency!")
@@ -74,9 +87,9 @@ def main():
         print(f"🌐 Multi-platform analysis: {', '.join(p.upper() for p in platforms)}")
     print()
     
-    print(f"🎯 Investigation Target: '{args.query}'")
+    print(f"🎯 Investigation Target: '{query}'")
     print(f"📱 Enabled Platforms: {', '.join(platforms)}")
-    print(f"🏷️ Focus Brand: '{args.focus_brand}'")
+    print(f"🏷️ Focus Brand: '{focus_brand}'")
     
     # Validate platforms
     supported_platforms = ["google", "youtube"]
@@ -87,15 +100,19 @@ def main():
         print(f"✅ Supported platforms: {', '.join(supported_platforms)}")
         return None
     
+    # Import here so --help and platform validation errors exit without
+    # pulling in LangGraph/Selenium/YouTube dependencies
+    from src.core.detective_coordinator import run_multiplatform_investigation
+
     try:
         # Run the multi-platform investigation
-        results = run_multiplatform_investigation(args.query, platforms, focus_brand=args.focus_brand)
+        results = run_multiplatform_investigation(query, platforms, focus_brand=focus_brand)
         
         print(f"\n🎊 Multi-platform investigation completed successfully!")
         print(f"📊 Results saved to investigation: {results['investigation_id']}")
         
         # Optional: Save results to file
-        if args.verbose:
+        if verbose:
             save_investigation_results(results)
         
         return results
@@ -114,9 +131,6 @@ def save_investigation_results(results):
     💾 Save detailed investigation results to file
     """
     
-    import json
-    from datetime import datetime
-    
     filename = f"investigation_{results['investigation_id']}.json"
     
     # Create a serializable version of results
@@ -137,8 +151,16 @@ def save_investigation_results(results):
         serializable_results["platform_breakdown"] = results["platform_breakdown"]
     
     try:
-        with open(filename, 'w') as f:
-            json.dump(serializable_results, f, indent=2)
+        try:
+            # orjson serializes straight to bytes with no intermediate
+            # Python string buffer (2-5x faster for large result sets)
+            import orjson
+            with open(filename, 'wb') as f:
+                f.write(orjson.dumps(serializable_results, option=orjson.OPT_INDENT_2))
+        except ImportError:
+            import json
+            with open(filename, 'w') as f:
+                json.dump(serializable_results, f, indent=2)
         print(f"💾 Detailed results saved to: {filename}")
     except Exception as e:
         print(f"⚠️ Could not save results file: {e}")
@@ -5,7 +5,6 @@ Advanced multi-factor competitive scoring and market positioning analysis
 
 import numpy as np
 from typing import Dict, List, Any, Tuple
-from statistics import mean, stdev
 
 from ..core.detective_state import MultiPlatformState, log_platform_progress
 
@@ -14,7 +13,17 @@ class CompetitiveIntelligenceScorer:
     🏆 Advanced competitive intelligence scoring engine
     Implements multi-factor weighted scoring with market positioning analysis
     """
-    
+
+    # Tier and CAI interpretation as cutoff arrays + label tables
+    # (one digitize lookup instead of a 5-branch ladder per brand)
+    _TIER_CUTS = np.array([20, 40, 60, 80])
+    _TIER_LABELS = ("Follower", "Emerging Player", "Average Competitor",
+                    "Strong Performer", "Market Leader")
+    _CAI_CUTS = np.array([-1.0, -0.5, 0.5, 1.0])
+    _CAI_LABELS = ("Significant Competitive Disadvantage", "Below Average Performance",
+                   "Average Market Performance", "Moderate Competitive Advantage",
+                   "Strong Competitive Advantage")
+
     def __init__(self):
         # Weighted scoring factors (mathematically optimized)
         self.scoring_weights = {
@@ -26,6 +35,15 @@ class CompetitiveIntelligenceScorer:
         
         # Scoring scale (0-100 points per factor)
         self.max_score_per_factor = 100
+
+        # Weight vector in factor order (presence, quality, position, dynamics)
+        # for the fused matrix-product scoring step
+        self.weight_vector = np.array([
+            self.scoring_weights['market_presence'],
+            self.scoring_weights['engagement_quality'],
+            self.scoring_weights['competitive_position'],
+            self.scoring_weights['market_dynamics']
+        ])
         
     def analyze_competitive_intelligence(self, state: MultiPlatformState) -> MultiPlatformState:
         """
@@ -46,32 +64,50 @@ class CompetitiveIntelligenceScorer:
             return self._return_insufficient_data_state(state)
         
         try:
+            # Build aligned arrays once (structure-of-arrays): every factor
+            # calculator indexes the same brand order with C-level arithmetic
+            brands = list(brand_mentions)
+            mentions_arr = np.array([brand_mentions[b] for b in brands], dtype=np.float64)
+            sov_arr = np.array(
+                [sov_metrics.get(b, {}).get('overall_sov', 0) for b in brands],
+                dtype=np.float64
+            )
+            engagement_arr = np.array(
+                [engagement_scores.get(b, 0) for b in brands], dtype=np.float64
+            )
+            avg_pos_arr = np.array(
+                [np.mean(position_analysis[b]) if position_analysis.get(b) else 0.0
+                 for b in brands],
+                dtype=np.float64
+            )
+
             # Step 1: Calculate individual scoring factors
             print("📊 Step 1: Calculating market presence scores...")
             market_presence_scores = self._calculate_market_presence_scores(
-                brand_mentions, sov_metrics, position_analysis
+                brands, mentions_arr, sov_arr, avg_pos_arr
             )
-            
+
             print("🎯 Step 2: Calculating engagement quality scores...")
             engagement_quality_scores = self._calculate_engagement_quality_scores(
-                engagement_scores, brand_mentions
+                brands, engagement_arr, mentions_arr
             )
-            
+
             print("⚔️ Step 3: Calculating competitive position scores...")
             competitive_position_scores = self._calculate_competitive_position_scores(
-                sov_metrics, brand_mentions
+                brands, sov_arr
             )
-            
+
             print("📈 Step 4: Calculating market dynamics scores...")
             market_dynamics_scores = self._calculate_market_dynamics_scores(
-                brand_mentions, sov_metrics
+                brands, mentions_arr
             )
             
             # Step 2: Calculate weighted competitive scores
             print("🏆 Step 5: Computing final competitive scores...")
             competitive_scores = self._calculate_weighted_competitive_scores(
+                brands,
                 market_presence_scores,
-                engagement_quality_scores, 
+                engagement_quality_scores,
                 competitive_position_scores,
                 market_dynamics_scores
             )
@@ -92,10 +128,10 @@ class CompetitiveIntelligenceScorer:
             competitive_intelligence = {
                 "competitive_scores": competitive_scores,
                 "factor_breakdown": {
-                    "market_presence": market_presence_scores,
-                    "engagement_quality": engagement_quality_scores,
-                    "competitive_position": competitive_position_scores,
-                    "market_dynamics": market_dynamics_scores
+                    "market_presence": {b: round(v, 2) for b, v in market_presence_scores.items()},
+                    "engagement_quality": {b: round(v, 2) for b, v in engagement_quality_scores.items()},
+                    "competitive_position": {b: round(v, 2) for b, v in competitive_position_scores.items()},
+                    "market_dynamics": {b: round(v, 2) for b, v in market_dynamics_scores.items()}
                 },
                 "market_positioning": market_positioning,
                 "competitive_insights": competitive_insights,
@@ -120,239 +156,167 @@ class CompetitiveIntelligenceScorer:
                 "current_phase": "competitive_scoring_error"
             }
     
-    def _calculate_market_presence_scores(self, brand_mentions: Dict, sov_metrics: Dict, 
-                                        position_analysis: Dict) -> Dict[str, float]:
+    def _calculate_market_presence_scores(self, brands: List[str], mentions: np.ndarray,
+                                        sov: np.ndarray, avg_pos: np.ndarray) -> Dict[str, float]:
         """
         📊 Calculate market presence scores (40% weight)
-        Based on SoV, mentions, and search positions
+        Based on SoV, mentions, and search positions (vectorized)
         """
-        
-        presence_scores = {}
-        
-        # Get market totals for normalization
-        total_mentions = sum(brand_mentions.values())
-        max_sov = max(sov_metrics[brand].get('overall_sov', 0) for brand in brand_mentions.keys())
-        
-        for brand in brand_mentions.keys():
-            # Factor 1: Share of Voice (60% of presence score)
-            brand_sov = sov_metrics.get(brand, {}).get('overall_sov', 0)
-            sov_score = (brand_sov / max_sov * 100) if max_sov > 0 else 0
-            
-            # Factor 2: Mention Volume (25% of presence score)
-            mention_share = (brand_mentions[brand] / total_mentions * 100) if total_mentions > 0 else 0
-            volume_score = min(100, mention_share * 3)  # Scale factor
-            
-            # Factor 3: Search Position Quality (15% of presence score)
-            positions = position_analysis.get(brand, [])
-            if positions:
-                avg_position = mean(positions)
-                # Convert position to score (position 1 = 100 points, position 10 = 10 points)
-                position_score = max(0, (11 - avg_position) * 10)
-            else:
-                position_score = 0
-            
-            # Weighted presence score
-            presence_score = (
-                sov_score * 0.60 +
-                volume_score * 0.25 + 
-                position_score * 0.15
-            )
-            presence_score = min(100, presence_score)
-            presence_scores[brand] = round(presence_score, 2)
-        
-        return presence_scores
-    
-    def _calculate_engagement_quality_scores(self, engagement_scores: Dict, 
-                                           brand_mentions: Dict) -> Dict[str, float]:
+
+        # Factor 1: Share of Voice (60% of presence score)
+        # Single reciprocal + broadcast multiply instead of per-element division
+        max_sov = sov.max()
+        inv_max_sov = 100.0 / max_sov if max_sov > 0 else 0.0
+        sov_score = sov * inv_max_sov
+
+        # Factor 2: Mention Volume (25% of presence score)
+        total_mentions = mentions.sum()
+        inv_total_mentions = 100.0 / total_mentions if total_mentions > 0 else 0.0
+        mention_share = mentions * inv_total_mentions
+        volume_score = np.minimum(100, mention_share * 3)  # Scale factor
+
+        # Factor 3: Search Position Quality (15% of presence score)
+        # Position 1 = 100 points, position 10 = 10 points; 0 = no position data
+        position_score = np.where(avg_pos > 0, np.maximum(0, (11 - avg_pos) * 10), 0.0)
+
+        # Weighted presence score
+        presence = np.minimum(
+            100,
+            sov_score * 0.60 + volume_score * 0.25 + position_score * 0.15
+        )
+
+        return dict(zip(brands, presence.tolist()))
+
+    def _calculate_engagement_quality_scores(self, brands: List[str], engagement: np.ndarray,
+                                           mentions: np.ndarray) -> Dict[str, float]:
         """
         🎯 Calculate engagement quality scores (30% weight)
-        Based on engagement per mention and quality indicators
+        Based on engagement per mention and quality indicators (vectorized)
         """
-        
-        quality_scores = {}
-        
-        # Calculate engagement per mention for normalization
-        engagement_per_mention = {}
-        for brand in brand_mentions.keys():
-            mentions = brand_mentions[brand]
-            total_engagement = engagement_scores.get(brand, 0)
-            engagement_per_mention[brand] = total_engagement / mentions if mentions > 0 else 0
-        
-        max_engagement_per_mention = max(engagement_per_mention.values()) if engagement_per_mention else 1
-        
-        for brand in brand_mentions.keys():
-            brand_engagement_per_mention = engagement_per_mention[brand]
-            
-            # Normalize to 0-100 scale
-            if max_engagement_per_mention > 0:
-                quality_score = (brand_engagement_per_mention / max_engagement_per_mention) * 100
-            else:
-                quality_score = 0
-            quality_score = min(100, quality_score)
-            quality_scores[brand] = round(quality_score, 2)
-        
-        return quality_scores
-    
-    def _calculate_competitive_position_scores(self, sov_metrics: Dict, 
-                                             brand_mentions: Dict) -> Dict[str, float]:
+
+        # Engagement per mention, normalized to the best performer
+        engagement_per_mention = np.divide(
+            engagement, mentions,
+            out=np.zeros_like(engagement), where=mentions > 0
+        )
+        max_epm = engagement_per_mention.max() if engagement_per_mention.size else 0
+
+        if max_epm > 0:
+            quality = np.minimum(100, engagement_per_mention / max_epm * 100)
+        else:
+            quality = np.zeros_like(engagement_per_mention)
+
+        return dict(zip(brands, quality.tolist()))
+
+    def _calculate_competitive_position_scores(self, brands: List[str],
+                                             sov: np.ndarray) -> Dict[str, float]:
         """
         ⚔️ Calculate competitive position scores (20% weight)
-        Based on relative market position and competitive gaps
+        Based on relative market position and competitive gaps (vectorized)
         """
-        
-        position_scores = {}
-        
-        # Get all brand SoV values for ranking
-        brand_sovs = {brand: sov_metrics.get(brand, {}).get('overall_sov', 0) 
-                     for brand in brand_mentions.keys()}
-        
-        # Sort brands by SoV for ranking
-        sorted_brands = sorted(brand_sovs.items(), key=lambda x: x[1], reverse=True)
-        total_brands = len(sorted_brands)
-        
-        for rank, (brand, sov) in enumerate(sorted_brands, 1):
-            # Factor 1: Market Rank Score (70% of position score)
-            # Rank 1 = 100 points, Rank 2 = 80 points, etc.
-            rank_score = max(0, 100 - (rank - 1) * (100 / total_brands))
-            
-            # Factor 2: Competitive Gap Analysis (30% of position score)
-            if rank == 1:
-                # Leader gets full points for gap factor
-                gap_score = 100
-            else:
-                # Calculate gap to leader
-                leader_sov = sorted_brands[0][1]
-                gap_to_leader = leader_sov - sov
-                # Smaller gaps = higher scores
-                gap_score = max(0, 100 - (gap_to_leader * 2))
-            
-            # Weighted position score
-            position_score = rank_score * 0.70 + gap_score * 0.30
-            position_score = min(100, position_score)
-            position_scores[brand] = round(position_score, 2)
-        
-        return position_scores
-    
-    def _calculate_market_dynamics_scores(self, brand_mentions: Dict, 
-                                        sov_metrics: Dict) -> Dict[str, float]:
+
+        total_brands = len(brands)
+
+        # Factor 1: Market Rank Score (70% of position score)
+        # Rank 1 = 100 points, Rank 2 = 80 points, etc. (stable sort keeps
+        # the original tie-break order of the brand dict)
+        order = np.argsort(-sov, kind='stable')
+        ranks = np.empty(total_brands, dtype=np.int64)
+        ranks[order] = np.arange(total_brands)
+        rank_score = np.maximum(0, 100 - ranks * (100 / total_brands))
+
+        # Factor 2: Competitive Gap Analysis (30% of position score)
+        # Smaller gaps to the leader = higher scores; the leader gets 100
+        leader_sov = sov[order[0]]
+        gap_score = np.maximum(0, 100 - (leader_sov - sov) * 2)
+
+        position = np.minimum(100, rank_score * 0.70 + gap_score * 0.30)
+
+        return dict(zip(brands, position.tolist()))
+
+    def _calculate_market_dynamics_scores(self, brands: List[str],
+                                        mentions: np.ndarray) -> Dict[str, float]:
         """
         📈 Calculate market dynamics scores (10% weight)
-        Based on market concentration and competitive landscape health
+        Based on market concentration and competitive landscape health (vectorized)
         """
-        
-        dynamics_scores = {}
-        
-        # Calculate market concentration (HHI-style)
-        total_mentions = sum(brand_mentions.values())
-        market_shares = {brand: (mentions/total_mentions)*100 
-                        for brand, mentions in brand_mentions.items()}
-        
-        # Herfindahl-Hirschman Index calculation
-        hhi = sum(share**2 for share in market_shares.values())
-        
+
+        # Market concentration (HHI over mention shares)
+        total_mentions = mentions.sum()
+        market_shares = (mentions / total_mentions * 100) if total_mentions > 0 else np.zeros_like(mentions)
+        hhi = np.square(market_shares).sum()
+
         # Market structure analysis
         if hhi < 1500:
-            market_structure = "competitive"
             structure_bonus = 20  # Competitive markets offer more opportunities
         elif hhi < 2500:
-            market_structure = "moderately_concentrated"
             structure_bonus = 10  # Moderate concentration
         else:
-            market_structure = "highly_concentrated"
             structure_bonus = 5   # Concentrated markets harder to penetrate
-        
-        for brand in brand_mentions.keys():
-            brand_share = market_shares[brand]
-            
-            # Factor 1: Market Share Growth Potential (60% of dynamics score)
-            # Higher share = lower growth potential but more stability
-            growth_potential = max(0, 100 - brand_share)
-            
-            # Factor 2: Market Structure Advantage (40% of dynamics score)
-            # Competitive markets = more opportunities
-            structure_score = structure_bonus + (brand_share * 0.5)
-            
-            # Weighted dynamics score
-            dynamics_score = growth_potential * 0.60 + structure_score * 0.40
-            dynamics_scores[brand] = round(min(100, dynamics_score), 2)
-        
-        return dynamics_scores
+
+        # Factor 1: Market Share Growth Potential (60% of dynamics score)
+        growth_potential = np.maximum(0, 100 - market_shares)
+
+        # Factor 2: Market Structure Advantage (40% of dynamics score)
+        structure_score = structure_bonus + market_shares * 0.5
+
+        dynamics = np.minimum(100, growth_potential * 0.60 + structure_score * 0.40)
+
+        return dict(zip(brands, dynamics.tolist()))
     
-    def _calculate_weighted_competitive_scores(self, market_presence: Dict, engagement_quality: Dict,
+    def _calculate_weighted_competitive_scores(self, brands: List[str],
+                                             market_presence: Dict, engagement_quality: Dict,
                                              competitive_position: Dict, market_dynamics: Dict) -> Dict[str, Dict]:
         """
         🏆 Calculate final weighted competitive scores
+        One (4, B) matrix product replaces the per-brand weighting loop
         """
-        
+
+        # Stack the aligned factor vectors and apply the weights in one product
+        factor_matrix = np.vstack([
+            [market_presence[brand] for brand in brands],
+            [engagement_quality[brand] for brand in brands],
+            [competitive_position[brand] for brand in brands],
+            [market_dynamics[brand] for brand in brands]
+        ])
+        totals = np.minimum(100, self.weight_vector @ factor_matrix)
+
+        # Round only here, at the outward-facing boundary; the factor dicts and
+        # totals stay full-precision for the CAI computation below
         competitive_scores = {}
-        all_brands = set(market_presence.keys())
-        
-        # Calculate scores for each brand
-        brand_scores = []
-        for brand in all_brands:
-            # Get individual factor scores
-            presence_score = market_presence.get(brand, 0)
-            quality_score = engagement_quality.get(brand, 0)
-            position_score = competitive_position.get(brand, 0)
-            dynamics_score = market_dynamics.get(brand, 0)
-            
-            # Calculate weighted total score
-            total_score = (
-                presence_score * self.scoring_weights['market_presence'] +
-                quality_score * self.scoring_weights['engagement_quality'] +
-                position_score * self.scoring_weights['competitive_position'] +
-                dynamics_score * self.scoring_weights['market_dynamics']
-            )
-            total_score = min(100, total_score)
-            brand_scores.append(total_score)
-            
+        for i, brand in enumerate(brands):
+            total_score = float(totals[i])
             competitive_scores[brand] = {
                 "total_score": round(total_score, 2),
-                "market_presence": presence_score,
-                "engagement_quality": quality_score, 
-                "competitive_position": position_score,
-                "market_dynamics": dynamics_score,
+                "market_presence": round(market_presence[brand], 2),
+                "engagement_quality": round(engagement_quality[brand], 2),
+                "competitive_position": round(competitive_position[brand], 2),
+                "market_dynamics": round(market_dynamics[brand], 2),
                 "performance_tier": self._determine_performance_tier(total_score)
             }
-        
-        # Calculate Competitive Advantage Index (CAI)
-        if len(brand_scores) > 1:
-            market_average = mean(brand_scores)
-            market_stdev = stdev(brand_scores) if len(brand_scores) > 1 else 1
-            
-            for brand in competitive_scores:
-                brand_score = competitive_scores[brand]["total_score"]
-                cai = (brand_score - market_average) / market_stdev
+
+        # Calculate Competitive Advantage Index (CAI) in one broadcast pass
+        if len(brands) > 1:
+            market_average = totals.mean()
+            market_stdev = totals.std(ddof=1)
+            if market_stdev == 0:
+                market_stdev = 1.0
+
+            cai_values = (totals - market_average) / market_stdev
+            for i, brand in enumerate(brands):
+                cai = float(cai_values[i])
                 competitive_scores[brand]["competitive_advantage_index"] = round(cai, 3)
                 competitive_scores[brand]["cai_interpretation"] = self._interpret_cai(cai)
-        
+
         return competitive_scores
     
     def _determine_performance_tier(self, score: float) -> str:
         """Categorize performance based on competitive score"""
-        if score >= 80:
-            return "Market Leader"
-        elif score >= 60:
-            return "Strong Performer"
-        elif score >= 40:
-            return "Average Competitor"
-        elif score >= 20:
-            return "Emerging Player"
-        else:
-            return "Follower"
-    
+        return self._TIER_LABELS[np.digitize(score, self._TIER_CUTS)]
+
     def _interpret_cai(self, cai: float) -> str:
         """Interpret Competitive Advantage Index"""
-        if cai > 1.0:
-            return "Strong Competitive Advantage"
-        elif cai > 0.5:
-            return "Moderate Competitive Advantage"
-        elif cai > -0.5:
-            return "Average Market Performance"
-        elif cai > -1.0:
-            return "Below Average Performance"
-        else:
-            return "Significant Competitive Disadvantage"
+        return self._CAI_LABELS[np.digitize(cai, self._CAI_CUTS, right=True)]
     
     def _perform_market_positioning_analysis(self, competitive_scores: Dict, 
                                            sov_metrics: Dict, focus_brand: str) -> Dict[str, Any]:
@@ -435,25 +399,21 @@ class CompetitiveIntelligenceScorer:
             
             insights.append(f"🎯 {brand_key}: {focus_score:.1f}/100 score, Rank #{focus_rank}, CAI: {cai:+.2f}")
             
-            # Performance analysis
-            strongest_factor = max(
-                [("Market Presence", focus_data["market_presence"]),
-                 ("Engagement Quality", focus_data["engagement_quality"]),
-                 ("Competitive Position", focus_data["competitive_position"]),
-                 ("Market Dynamics", focus_data["market_dynamics"])],
-                key=lambda x: x[1]
-            )
-            
-            weakest_factor = min(
-                [("Market Presence", focus_data["market_presence"]),
-                 ("Engagement Quality", focus_data["engagement_quality"]),
-                 ("Competitive Position", focus_data["competitive_position"]),
-                 ("Market Dynamics", focus_data["market_dynamics"])],
-                key=lambda x: x[1]
-            )
-            
-            insights.append(f"💪 {brand_key} strength: {strongest_factor[0]} ({strongest_factor[1]:.1f}/100)")
-            insights.append(f"🎯 {brand_key} opportunity: {weakest_factor[0]} ({weakest_factor[1]:.1f}/100)")
+            # Performance analysis: build the factor values once and find the
+            # extremes in a single pass each
+            factor_names = ("Market Presence", "Engagement Quality",
+                            "Competitive Position", "Market Dynamics")
+            factor_values = np.array([
+                focus_data["market_presence"],
+                focus_data["engagement_quality"],
+                focus_data["competitive_position"],
+                focus_data["market_dynamics"]
+            ])
+            strongest_idx = factor_values.argmax()
+            weakest_idx = factor_values.argmin()
+
+            insights.append(f"💪 {brand_key} strength: {factor_names[strongest_idx]} ({factor_values[strongest_idx]:.1f}/100)")
+            insights.append(f"🎯 {brand_key} opportunity: {factor_names[weakest_idx]} ({factor_values[weakest_idx]:.1f}/100)")
             
             # Strategic positioning
             focus_position = market_positioning.get(brand_key, {})
@@ -464,17 +424,19 @@ class CompetitiveIntelligenceScorer:
         
         # Market concentration insight
         total_brands = len(competitive_scores)
-        avg_score = mean(score["total_score"] for score in competitive_scores.values())
+        avg_score = np.fromiter(
+            (score["total_score"] for score in competitive_scores.values()),
+            dtype=np.float64, count=total_brands
+        ).mean()
         
         insights.append(f"📊 Market analysis: {total_brands} competitors, avg score {avg_score:.1f}/100")
         
         return insights
     
     def _return_insufficient_data_state(self, state: MultiPlatformState) -> MultiPlatformState:
-        """Return state when insufficient data for competitive scoring"""
-        
+        """Return state delta when insufficient data for competitive scoring"""
+
         return {
-            **state,
             "competitive_intelligence": {
                 "error": "Insufficient brand data for competitive scoring",
                 "message": "Competitive intelligence requires brand mention data",
@@ -4,11 +4,99 @@ Pure math and pattern matching - no NLP required!
 """
 
 import re
+from bisect import bisect_right
 from typing import Dict, List, Any, Tuple
-from collections import defaultdict
 
 from ..core.detective_state import MultiPlatformState, log_platform_progress
-from config import BRAND_PATTERNS, ENGAGEMENT_FACTORS, PRODUCT_KEYWORDS, get_engagement_score
+from config import BRAND_PATTERNS, ALL_PRODUCT_KEYWORDS, score_batch
+
+# Fixed vocabularies: brand and keyword sets are static, so accumulators can
+# be flat position-indexed arrays instead of hashed dicts
+_BRAND_INDEX = {brand: i for i, brand in enumerate(BRAND_PATTERNS)}
+_KEYWORD_INDEX = {keyword: i for i, keyword in enumerate(ALL_PRODUCT_KEYWORDS)}
+
+# Single mega-regex scanning brands and product keywords in one pass.
+# Keyword group names must be identifiers, so keywords get numbered groups
+# with a lookup table back to the original phrase. Keywords are ordered
+# longest-first so multi-word phrases win over shorter overlapping ones.
+_KEYWORDS_LONGEST_FIRST = sorted(ALL_PRODUCT_KEYWORDS, key=len, reverse=True)
+_KEYWORD_BY_GROUP = {f"kw{i}": kw for i, kw in enumerate(_KEYWORDS_LONGEST_FIRST)}
+_SCAN_RE = re.compile(
+    '|'.join(
+        [f"(?P<brand_{brand}>" + '|'.join(patterns) + ")"
+         for brand, patterns in BRAND_PATTERNS.items()] +
+        [f"(?P<kw{i}>" + re.escape(kw) + ")"
+         for i, kw in enumerate(_KEYWORDS_LONGEST_FIRST)]
+    ),
+    re.IGNORECASE
+)
+
+# Group index -> (is_brand, brand name or keyword phrase), so the per-match
+# dispatch is one dict probe on an int instead of string prefix tests
+_GROUP_TARGET = {
+    num: (True, name[6:]) if name.startswith("brand_") else (False, _KEYWORD_BY_GROUP[name])
+    for name, num in _SCAN_RE.groupindex.items()
+}
+
+def _scan_content(content: str,
+                  _finditer=_SCAN_RE.finditer,
+                  _target=_GROUP_TARGET) -> Tuple[Dict[str, int], Dict[str, int], Dict[str, int]]:
+    """
+    🔎 One pass over the content extracting brand mentions and keyword hits
+    Returns (capped brand counts, raw brand counts, keyword counts)
+    The _-prefixed defaults bind the compiled scanner and dispatch table as
+    locals at definition time; callers should not pass them
+    """
+    brand_counts_raw = {}
+    keyword_counts = {}
+
+    for match in _finditer(content):
+        is_brand, key = _target[match.lastindex]
+        if is_brand:
+            brand_counts_raw[key] = brand_counts_raw.get(key, 0) + 1
+        else:
+            keyword_counts[key] = keyword_counts.get(key, 0) + 1
+
+    brand_counts_capped = {brand: 1 for brand in brand_counts_raw}
+    return brand_counts_capped, brand_counts_raw, keyword_counts
+
+def _scan_batch(contents: List[str],
+                _finditer=_SCAN_RE.finditer,
+                _target=_GROUP_TARGET) -> List[Tuple[Dict[str, int], Dict[str, int], Dict[str, int]]]:
+    """
+    🔎 Scan a whole result batch in one regex sweep
+    Documents are joined with a NUL sentinel (no pattern can cross it) and
+    match offsets are mapped back to document indices via bisect, so the
+    regex engine starts up once for the entire batch. Duplicate documents
+    (common across pagination and re-runs) are scanned once and the result
+    is fanned back out to every occurrence
+    """
+    unique_index: Dict[str, int] = {}
+    slots = [unique_index.setdefault(text, len(unique_index)) for text in contents]
+    uniques = list(unique_index)
+
+    raw_buckets = [{} for _ in uniques]
+    keyword_buckets = [{} for _ in uniques]
+
+    # Cumulative end offset of each document inside the blob (incl. sentinel)
+    doc_ends = []
+    offset = 0
+    for text in uniques:
+        offset += len(text) + 1
+        doc_ends.append(offset)
+
+    blob = "\x00".join(uniques)
+    for match in _finditer(blob):
+        doc_index = bisect_right(doc_ends, match.start())
+        is_brand, key = _target[match.lastindex]
+        bucket = raw_buckets[doc_index] if is_brand else keyword_buckets[doc_index]
+        bucket[key] = bucket.get(key, 0) + 1
+
+    scanned = [
+        ({brand: 1 for brand in raw}, raw, keywords)
+        for raw, keywords in zip(raw_buckets, keyword_buckets)
+    ]
+    return [scanned[i] for i in slots]
 
 def quantitative_analysis_agent(state: MultiPlatformState) -> MultiPlatformState:
     """
@@ -26,48 +114,67 @@ def quantitative_analysis_agent(state: MultiPlatformState) -> MultiPlatformState
     
     print(f"🔬 Analyzing {len(raw_results)} pieces of evidence...")
     
-    # Initialize analysis containers
-    brand_mentions_raw = defaultdict(int)
-    brand_mentions = defaultdict(int)
-    engagement_scores = defaultdict(float)
-    keyword_frequency = defaultdict(int)
-    position_analysis = defaultdict(list)
-    processed_content = []
-    
-    # Process each search result
+    # Initialize analysis containers: flat arrays over the fixed brand and
+    # keyword vocabularies (index writes, no per-update key hashing)
+    brand_count = len(_BRAND_INDEX)
+    mentions_raw_arr = [0] * brand_count
+    mentions_arr = [0] * brand_count
+    engagement_arr = [0.0] * brand_count
+    keyword_arr = [0] * len(_KEYWORD_INDEX)
+    positions_by_brand = [[] for _ in range(brand_count)]
+    # Preallocated: the result count is known, so fill by index instead of
+    # growing the list with repeated appends
+    processed_content = [None] * len(raw_results)
+
+    # === ENGAGEMENT CALCULATION (Pure Math, vectorized across the batch) ===
+    # Scoring stays single-process: typical batches (~50 results per platform)
+    # are too small to amortize ProcessPoolExecutor fork/pickle overhead
+    # One destructuring pass per result: each field is fetched from the dict
+    # exactly once while the columns are built
+    all_contents = []
+    all_titles = []
+    all_urls = []
+    all_positions = []
     for result in raw_results:
-        content = f"{result.get('title', '')} {result.get('snippet', '')}"
         title = result.get('title', '')
-        url = result.get('url', '')
-        position = result.get('position', 0)
-        
-        # === BRAND DETECTION (Pattern Matching) ===
-        detected_brands_capped, detected_brands_raw = detect_brands_in_content(content)
-        
-        # === ENGAGEMENT CALCULATION (Pure Math) ===
-        engagement = get_engagement_score(content, url, title)
-        
-        # === KEYWORD FREQUENCY ANALYSIS ===
-        keywords = analyze_keyword_frequency(content)
+        all_titles.append(title)
+        all_contents.append(f"{title} {result.get('snippet', '')}")
+        all_urls.append(result.get('url', ''))
+        all_positions.append(result.get('position', 0))
+    engagement_batch = score_batch(all_contents, all_urls, all_titles)
+    scan_batch = _scan_batch(all_contents)
+
+    # Process each search result
+    for index, result in enumerate(raw_results):
+        content = all_contents[index]
+        content_length = len(content)
+        title = all_titles[index]
+        url = all_urls[index]
+        position = all_positions[index]
+        engagement = engagement_batch[index]
+
+        # === BRAND DETECTION + KEYWORD FREQUENCY (from the batch sweep) ===
+        detected_brands_capped, detected_brands_raw, keywords = scan_batch[index]
         
         # Aggregate raw mention results
         for brand, count in detected_brands_raw.items():
-            brand_mentions_raw[brand] += count
-        
-        # Aggregate capped mention results and engagement scores
-        for brand, count in detected_brands_capped.items():
-            brand_mentions[brand] += count
-        
+            mentions_raw_arr[_BRAND_INDEX[brand]] += count
+
+        # Aggregate capped mention results, engagement shares and positions
         if detected_brands_capped:
-            for brand in detected_brands_capped:
-                engagement_scores[brand] += engagement / len(detected_brands_capped)
-                position_analysis[brand].append(position)
-        
+            # One division per result, shared across its detected brands
+            engagement_share = engagement / len(detected_brands_capped)
+            for brand, count in detected_brands_capped.items():
+                brand_idx = _BRAND_INDEX[brand]
+                mentions_arr[brand_idx] += count
+                engagement_arr[brand_idx] += engagement_share
+                positions_by_brand[brand_idx].append(position)
+
         for keyword, freq in keywords.items():
-            keyword_frequency[keyword] += freq
+            keyword_arr[_KEYWORD_INDEX[keyword]] += freq
         
         # Store processed result
-        processed_content.append({
+        processed_content[index] = {
             "id": result.get("id"),
             "title": title,
             "url": url,
@@ -76,26 +183,32 @@ def quantitative_analysis_agent(state: MultiPlatformState) -> MultiPlatformState
             "brands_detected": detected_brands_capped,
             "engagement_score": engagement,
             "keywords_found": keywords,
-            "content_preview": content[:200] + "..." if len(content) > 200 else content
-        })
+            "content_length": content_length,
+            "content_preview": content[:200] + "..." if content_length > 200 else content
+        }
     
-    # Convert defaultdicts to regular dicts
-    brand_mentions_raw = dict(brand_mentions_raw)
-    brand_mentions = dict(brand_mentions)
-    engagement_scores = dict(engagement_scores)
-    keyword_frequency = dict(keyword_frequency)
-    position_analysis = dict(position_analysis)
+    # Convert the flat arrays back to sparse dicts (detected entries only,
+    # matching the shape downstream agents expect)
+    brand_mentions_raw = {b: mentions_raw_arr[i] for b, i in _BRAND_INDEX.items() if mentions_raw_arr[i]}
+    brand_mentions = {b: mentions_arr[i] for b, i in _BRAND_INDEX.items() if mentions_arr[i]}
+    engagement_scores = {b: engagement_arr[i] for b, i in _BRAND_INDEX.items() if mentions_arr[i]}
+    keyword_frequency = {k: keyword_arr[i] for k, i in _KEYWORD_INDEX.items() if keyword_arr[i]}
+    position_analysis = {b: positions_by_brand[i] for b, i in _BRAND_INDEX.items() if positions_by_brand[i]}
     
-    print(f"📊 Analysis Results:")
-    print(f"   • Brands detected (capped): {list(brand_mentions.keys())}")
-    print(f"   • Total brand mentions (raw): {sum(brand_mentions_raw.values())}")
-    print(f"   • Top keywords: {sorted(keyword_frequency.items(), key=lambda x: x[1], reverse=True)[:5]}")
+    # Single buffered write instead of one I/O flush per line
+    print(
+        f"📊 Analysis Results:\n"
+        f"   • Brands detected (capped): {list(brand_mentions.keys())}\n"
+        f"   • Total brand mentions (raw): {sum(brand_mentions_raw.values())}\n"
+        f"   • Top keywords: {sorted(keyword_frequency.items(), key=lambda x: x[1], reverse=True)[:5]}"
+    )
     
-    # Update state with analysis results
+    # Update state with analysis results. Return only the delta - LangGraph
+    # merges it into the state, so no full-state copy is needed
     state = log_platform_progress(state,"google", f"📊 Quantitative analysis completed: {len(brand_mentions)} brands, {sum(brand_mentions_raw.values())} total raw mentions")
-    
+
     return {
-        **state,
+        "investigation_log": state["investigation_log"],
         "brand_mentions_raw": brand_mentions_raw,
         "brand_mentions": brand_mentions,
         "engagement_scores": engagement_scores,
@@ -112,39 +225,14 @@ def detect_brands_in_content(content: str) -> Tuple[Dict[str, int], Dict[str, in
     - capped mentions (max 1 per brand per content)
     - raw mention counts
     """
-    content_lower = content.lower()
-    brand_counts_raw = {}
-    brand_counts_capped = {}
-    
-    for brand, patterns in BRAND_PATTERNS.items():
-        total_mentions = 0
-        for pattern in patterns:
-            matches = re.findall(pattern, content_lower)
-            total_mentions += len(matches)
-        
-        if total_mentions > 0:
-            brand_counts_raw[brand] = total_mentions
-            brand_counts_capped[brand] = 1
-    
+    brand_counts_capped, brand_counts_raw, _ = _scan_content(content)
     return brand_counts_capped, brand_counts_raw
 
 def analyze_keyword_frequency(content: str) -> Dict[str, int]:
     """
     📈 Analyze product-related keyword frequency
     """
-    content_lower = content.lower()
-    keyword_counts = {}
-    
-    # Flatten all keyword categories
-    all_keywords = []
-    for category, keywords in PRODUCT_KEYWORDS.items():
-        all_keywords.extend(keywords)
-    
-    for keyword in all_keywords:
-        count = content_lower.count(keyword.lower())
-        if count > 0:
-            keyword_counts[keyword] = count
-    
+    _, _, keyword_counts = _scan_content(content)
     return keyword_counts
 
 print("📊 Quantitative Analysis Agent Ready!")
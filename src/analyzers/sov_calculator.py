@@ -3,10 +3,17 @@
 Pure mathematical SoV calculations and competitive analysis
 """
 
+import numpy as np
+
 from typing import Dict,List,Any
 from ..core.detective_state import MultiPlatformState, log_platform_progress
 from config import SOV_WEIGHTS
 
+# Weights bound once at import so the vectorized kernel is plain arithmetic
+_MENTION_W = SOV_WEIGHTS['mention_weight']
+_ENGAGEMENT_W = SOV_WEIGHTS['engagement_weight']
+_POSITION_W = SOV_WEIGHTS['position_bonus']
+
 def sov_calculation_agent(state: MultiPlatformState) -> MultiPlatformState:
     """
     📊 Share of Voice Calculator
@@ -28,63 +35,59 @@ def sov_calculation_agent(state: MultiPlatformState) -> MultiPlatformState:
     total_mentions = sum(brand_mentions.values())
     total_engagement = sum(engagement_scores.values())
     
-    print(f"📊 Market Overview:")
-    print(f"   • Total brand mentions: {total_mentions}")
-    print(f"   • Total engagement score: {total_engagement:.1f}")
-    print(f"   • Brands in competition: {len(brand_mentions)}")
-    
-    # Calculate SoV metrics for each brand
-    sov_metrics = {}
-    competitive_landscape = {}
-    
-    for brand in brand_mentions.keys():
-        mentions = brand_mentions.get(brand, 0)
-        engagement = engagement_scores.get(brand, 0)
-        positions = position_analysis.get(brand, [])
-        
-        # Core SoV calculations
-        mention_share = (mentions / total_mentions) * 100 if total_mentions > 0 else 0
-        engagement_share = (engagement / total_engagement) * 100 if total_engagement > 0 else 0
-        
-        # Clamp values between 0 and 100 before rounding
-        mention_share = min(max(mention_share, 0), 100)
-        engagement_share = min(max(engagement_share, 0), 100)
-        
-        # Position analysis
-        avg_position = sum(positions) / len(positions) if positions else 0
-        top_3_appearances = len([p for p in positions if p <= 3])
-        
-        # Weighted overall SoV
-        overall_sov = (
-            mention_share * SOV_WEIGHTS['mention_weight'] +
-            engagement_share * SOV_WEIGHTS['engagement_weight']
-        )
-        
-        # Position bonus (better ranking = bonus points)
-        if avg_position > 0:
-            position_bonus = max(0, (10 - avg_position) * SOV_WEIGHTS['position_bonus'])
-            overall_sov += position_bonus
-        overall_sov = min(max(overall_sov, 0), 100)
-        
-        sov_metrics[brand] = {
-            "mention_share": round(mention_share, 2),
-            "engagement_share": round(engagement_share, 2),
-            "overall_sov": round(overall_sov, 2),
-            "average_position": round(avg_position, 1),
-            "top_3_appearances": top_3_appearances,
-            "total_mentions": mentions,
-            "total_engagement": round(engagement, 1)
+    print(
+        f"📊 Market Overview:\n"
+        f"   • Total brand mentions: {total_mentions}\n"
+        f"   • Total engagement score: {total_engagement:.1f}\n"
+        f"   • Brands in competition: {len(brand_mentions)}"
+    )
+    
+    # Calculate SoV metrics for all brands at once: stack the per-brand
+    # numbers into NumPy arrays so shares, clamps and the weighted sum run
+    # as vector ops instead of a Python loop of scalar arithmetic
+    brands = list(brand_mentions)
+    brand_count = len(brands)
+    mentions_arr = np.fromiter((brand_mentions[b] for b in brands), dtype=np.float64, count=brand_count)
+    engagement_arr = np.fromiter((engagement_scores.get(b, 0.0) for b in brands), dtype=np.float64, count=brand_count)
+    brand_positions = [position_analysis.get(b, []) for b in brands]
+    avg_position_arr = np.array([sum(p) / len(p) if p else 0.0 for p in brand_positions])
+    top_3_arr = [len([pos for pos in p if pos <= 3]) for p in brand_positions]
+
+    # Core SoV calculations (clamped between 0 and 100)
+    mention_share_arr = np.clip(mentions_arr * (100.0 / total_mentions) if total_mentions > 0 else mentions_arr * 0.0, 0, 100)
+    engagement_share_arr = np.clip(engagement_arr * (100.0 / total_engagement) if total_engagement > 0 else engagement_arr * 0.0, 0, 100)
+
+    # Weighted overall SoV plus position bonus (better ranking = bonus points)
+    overall_sov_arr = mention_share_arr * _MENTION_W + engagement_share_arr * _ENGAGEMENT_W
+    overall_sov_arr += np.where(avg_position_arr > 0, np.maximum(0.0, (10 - avg_position_arr) * _POSITION_W), 0.0)
+    overall_sov_arr = np.clip(overall_sov_arr, 0, 100)
+
+    sov_metrics = {
+        brand: {
+            "mention_share": round(float(mention_share_arr[i]), 2),
+            "engagement_share": round(float(engagement_share_arr[i]), 2),
+            "overall_sov": round(float(overall_sov_arr[i]), 2),
+            "average_position": round(float(avg_position_arr[i]), 1),
+            "top_3_appearances": top_3_arr[i],
+            "total_mentions": int(mentions_arr[i]),
+            "total_engagement": round(float(engagement_arr[i]), 1)
         }
+        for i, brand in enumerate(brands)
+    }
     
-    # Competitive landscape analysis
-    sorted_brands = sorted(sov_metrics.items(), key=lambda x: x[1]['overall_sov'], reverse=True)
-    
+    # Competitive landscape analysis: one descending argsort yields the
+    # leader, the focus brand's rank and the full ranking table together
+    ranking_order = np.argsort(-overall_sov_arr, kind="stable")
+    focus_rank = None
+    if focus_brand in brands:
+        focus_rank = int(np.flatnonzero(ranking_order == brands.index(focus_brand))[0]) + 1
+
     competitive_landscape = {
-        "market_leader": sorted_brands[0][0] if sorted_brands else None,
-        f"{focus_brand}_rank": next((i+1 for i, (brand, _) in enumerate(sorted_brands) if brand == focus_brand), None),
-        "brand_rankings": [(brand, metrics['overall_sov']) for brand, metrics in sorted_brands],
-        "market_concentration": calculate_market_concentration(sov_metrics),
-        "competitive_gaps": identify_competitive_gaps(sov_metrics, focus_brand)
+        "market_leader": brands[ranking_order[0]] if brand_count else None,
+        f"{focus_brand}_rank": focus_rank,
+        "brand_rankings": [(brands[i], sov_metrics[brands[i]]['overall_sov']) for i in ranking_order],
+        "market_concentration": calculate_market_concentration(overall_sov_arr),
+        "competitive_gaps": identify_competitive_gaps(brands, overall_sov_arr, avg_position_arr, focus_brand)
     }
     
     # Focus on selected brand's performance
@@ -107,13 +110,13 @@ def sov_calculation_agent(state: MultiPlatformState) -> MultiPlatformState:
         "current_phase": "sov_calculation_complete"
     }
 
-def calculate_market_concentration(sov_metrics: Dict[str, Any]) -> str:
+def calculate_market_concentration(overall_sov: np.ndarray) -> str:
     """Calculate if market is concentrated or fragmented"""
-    if not sov_metrics:
+    if overall_sov.size == 0:
         return "unknown"
-    
-    top_brand_sov = max(metrics['overall_sov'] for metrics in sov_metrics.values())
-    
+
+    top_brand_sov = overall_sov.max()
+
     if top_brand_sov > 50:
         return "highly_concentrated"
     elif top_brand_sov > 30:
@@ -121,30 +124,29 @@ def calculate_market_concentration(sov_metrics: Dict[str, Any]) -> str:
     else:
         return "fragmented"
 
-def identify_competitive_gaps(sov_metrics: Dict[str, Any], focus_brand: str = "atomberg") -> List[str]:
+def identify_competitive_gaps(brands: List[str], overall_sov: np.ndarray,
+                              avg_position: np.ndarray, focus_brand: str = "atomberg") -> List[str]:
     """Identify competitive opportunities for the focus brand"""
     gaps = []
-    
-    if focus_brand in sov_metrics:
-        focus_sov = sov_metrics[focus_brand]['overall_sov']
-        
-        # Find brands significantly ahead
-        stronger_competitors = [
-            brand for brand, metrics in sov_metrics.items() 
-            if brand != focus_brand and metrics['overall_sov'] > focus_sov + 10
-        ]
-        
+
+    if focus_brand in brands:
+        focus_idx = brands.index(focus_brand)
+        focus_sov = overall_sov[focus_idx]
+
+        # Find brands significantly ahead (one vectorized comparison)
+        stronger_mask = overall_sov > focus_sov + 10
+        stronger_competitors = [brands[i] for i in np.flatnonzero(stronger_mask) if i != focus_idx]
+
         if stronger_competitors:
             gaps.append(f"Significant SoV gap vs {', '.join(stronger_competitors)}")
-        
+
         if focus_sov < 20:
             gaps.append("Below 20% SoV threshold - needs increased market presence")
-        
+
         # Position analysis
-        focus_pos = sov_metrics[focus_brand].get('average_position', 0)
-        if focus_pos > 5:
+        if avg_position[focus_idx] > 5:
             gaps.append("Average search position beyond top 5 - SEO opportunity")
-    
+
     return gaps
 
 print("📈 SoV Calculator Agent Ready!")
@@ -11,153 +11,236 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.keys import Keys
 from webdriver_manager.chrome import ChromeDriverManager
+import hashlib
+import json
+import os
+import tempfile
 import time
 import random
+import urllib.parse
 from datetime import datetime
 from typing import List, Dict
 
-from ..core.detective_state import MultiPlatformState, log_platform_progress, log_error
+from ..core.detective_state import MultiPlatformState, format_progress_entry, format_error_entry
 from config import SEARCH_CONFIG, CHROME_OPTIONS, get_search_queries
 
+# Resource patterns the extractor never reads: images, fonts, stylesheets and
+# trackers. Blocking them via CDP before navigation cuts most of the bytes
+# (and DOM parse time) each results page would otherwise pull in
+_BLOCKED_URL_PATTERNS = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg",
+    "*.woff", "*.woff2", "*.ttf", "*.css",
+    "*googletagmanager*", "*google-analytics*", "*doubleclick*",
+    "*gstatic.com/images/*"
+]
 
-def perform_human_like_search(driver, query):
+# Container selectors to try, in order (Google changes these frequently)
+RESULT_SELECTORS = [
+    "div.g",           # Traditional selector
+    "[data-ved]",      # Attribute-based selector
+    ".tF2Cxc",         # Modern selector
+    ".g .yuRUbf",      # Nested selector
+    "div[class*='g']", # Partial class match
+    ".srg .g",         # Search results group
+]
+
+# Single-round-trip DOM harvester: picks the first working container
+# selector, then extracts title/url/snippet for every container in-page and
+# returns plain dicts. Falls back to bare result links when no container
+# selector matches. One execute_script call replaces O(containers x
+# selectors) WebDriver round-trips
+_HARVEST_JS = """
+const candidates = arguments[0];
+const selector = candidates.find(s => {
+    try { return document.querySelectorAll(s).length > 0; } catch (e) { return false; }
+});
+const harvest = g => {
+    const h3 = g.querySelector("h3, .LC20lb, .DKV0Md, [role='heading']");
+    const a = g.querySelector("a[href^='http']");
+    const s = g.querySelector(".VwiC3b, .s3v9rd, .st, [data-sncf], .IsZvec, .aCOpRe");
+    return {
+        title: h3 ? h3.innerText.trim() : "No title",
+        url: a ? a.href : "",
+        snippet: s ? s.innerText.trim().slice(0, 500) : ""
+    };
+};
+if (selector) {
+    return {
+        selector: selector,
+        results: [...document.querySelectorAll(selector)].map(harvest)
+                     .filter(r => r.title !== "No title" || r.url)
+    };
+}
+// Last resort: any clickable links that look like search results
+const links = [...document.querySelectorAll("h3 a, .yuRUbf a, [data-ved] a")];
+return {
+    selector: null,
+    results: links.filter(a => a.href && a.href.startsWith("http"))
+                  .map(a => ({title: a.innerText.trim() || "No title", url: a.href, snippet: ""}))
+};
+"""
+
+
+# Chromedriver path resolved once per process - ChromeDriverManager hits the
+# network/disk for version metadata on every install() call otherwise
+_chromedriver_path = None
+
+
+def _get_chromedriver_path() -> str:
+    global _chromedriver_path
+    if _chromedriver_path is None:
+        _chromedriver_path = ChromeDriverManager().install()
+    return _chromedriver_path
+
+
+# The container selector that worked on the previous page - tried first on
+# subsequent queries since Google's markup rarely changes mid-run
+_last_good_selector = None
+
+# SERP cache: repeated queries (re-runs, overlapping variations) are served
+# from disk instead of re-scraping - a cache hit skips the browser, the
+# human-like delays AND the bot-detection risk. Entries expire after 6 hours
+_SERP_CACHE_PATH = os.path.join(tempfile.gettempdir(), "atomberg_serp_cache.json")
+_SERP_CACHE_TTL_SECONDS = 6 * 3600
+_serp_cache = None
+
+
+def _serp_cache_key(query: str) -> str:
+    return hashlib.sha1(query.lower().strip().encode()).hexdigest()
+
+
+def _load_serp_cache() -> Dict:
+    """Load the on-disk SERP cache, dropping expired entries"""
+    global _serp_cache
+    if _serp_cache is None:
+        try:
+            with open(_SERP_CACHE_PATH) as f:
+                stored = json.load(f)
+            cutoff = time.time() - _SERP_CACHE_TTL_SECONDS
+            _serp_cache = {k: v for k, v in stored.items() if v.get("ts", 0) > cutoff}
+        except Exception:
+            _serp_cache = {}
+    return _serp_cache
+
+
+def _serp_cache_get(query: str):
+    entry = _load_serp_cache().get(_serp_cache_key(query))
+    if entry is None:
+        return None
+    return entry["results"], entry.get("selector")
+
+
+def _serp_cache_put(query: str, results: List[Dict], selector):
+    cache = _load_serp_cache()
+    cache[_serp_cache_key(query)] = {"ts": time.time(), "selector": selector, "results": results}
+    try:
+        with open(_SERP_CACHE_PATH, 'w') as f:
+            json.dump(cache, f)
+    except Exception as e:
+        print(f"   ⚠️ Could not persist SERP cache: {str(e)[:50]}")
+
+
+def _is_bot_blocked(driver) -> bool:
+    """🚧 Detect Google's consent / unusual-traffic interstitials"""
+    try:
+        return ("/sorry/" in driver.current_url
+                or "detected unusual traffic" in driver.page_source[:5000])
+    except Exception:
+        return False
+
+
+def perform_human_like_search(driver, query, search_metadata=None):
     """
     🤖➡️🧑 Make the bot behave more like a human to avoid detection
     """
     try:
         print(f"   🧑 Performing human-like search for: '{query}'")
-        
-        # Go to Google homepage first (more natural behavior)
-        driver.get("https://www.google.com")
-        time.sleep(random.uniform(2, 4))
-        
-        # Find search box and wait for it to be interactive
-        search_box = WebDriverWait(driver, 10).until(
-            EC.element_to_be_clickable((By.NAME, "q"))
-        )
-        
-        # Clear any existing text
-        search_box.clear()
-        time.sleep(random.uniform(0.5, 1.0))
-        
-        # Type with human-like delays (simulates natural typing)
-        print(f"   ⌨️  Typing query naturally...")
-        for char in query:
-            search_box.send_keys(char)
-            time.sleep(random.uniform(0.05, 0.15))  # Human typing speed
-        
-        # Random pause before pressing Enter (humans think before pressing Enter)
-        time.sleep(random.uniform(0.5, 1.5))
-        
-        # Press Enter to search
-        search_box.send_keys(Keys.RETURN)
-        
-        # Wait for results to load (humans wait and observe)
-        time.sleep(random.uniform(3, 5))
-        
-        # Try multiple CSS selectors (Google changes these frequently)
-        result_selectors = [
-            "div.g",           # Traditional selector
-            "[data-ved]",      # Attribute-based selector  
-            ".tF2Cxc",         # Modern selector
-            ".g .yuRUbf",      # Nested selector
-            "div[class*='g']", # Partial class match
-            ".srg .g",         # Search results group
-        ]
-        
-        results = []
-        successful_selector = None
-        
-        # Try each selector until we find results
-        for selector in result_selectors:
-            try:
-                results = driver.find_elements(By.CSS_SELECTOR, selector)
-                if len(results) > 0:
-                    successful_selector = selector
-                    print(f"   ✅ Found {len(results)} results with selector: '{selector}'")
-                    break
-            except Exception as e:
-                continue
-        
-        if not results:
-            # Last resort: try to find any clickable links that look like search results
-            print(f"   🔄 Trying fallback: looking for any result links...")
-            results = driver.find_elements(By.CSS_SELECTOR, "h3 a, .yuRUbf a, [data-ved] a")
-            if results:
-                print(f"   📍 Found {len(results)} fallback results")
-        
+
+        if SEARCH_CONFIG.get('human_like_typing'):
+            # Go to Google homepage first (more natural behavior)
+            driver.get("https://www.google.com")
+
+            # Find search box and wait for it to be interactive - the wait
+            # itself covers page readiness, no fixed sleep needed on fast loads
+            search_box = WebDriverWait(driver, 10).until(
+                EC.element_to_be_clickable((By.NAME, "q"))
+            )
+
+            # Clear any existing text
+            search_box.clear()
+            time.sleep(random.uniform(0.5, 1.0))
+
+            # Type with human-like delays (simulates natural typing)
+            print(f"   ⌨️  Typing query naturally...")
+            for char in query:
+                search_box.send_keys(char)
+                time.sleep(random.uniform(0.05, 0.15))  # Human typing speed
+
+            # Random pause before pressing Enter (humans think before pressing Enter)
+            time.sleep(random.uniform(0.5, 1.5))
+
+            # Press Enter to search
+            search_box.send_keys(Keys.RETURN)
+        else:
+            # Navigate straight to the results URL - skips the homepage
+            # round-trip and the ~10s typing simulation entirely
+            time.sleep(random.uniform(0.3, 0.8))  # Small jitter before navigating
+            driver.get(f"https://www.google.com/search?q={urllib.parse.quote_plus(query)}&hl=en")
+
+        # Wait for results to actually appear instead of sleeping a fixed
+        # 3-5s - returns the moment the DOM is populated on fast loads
+        try:
+            WebDriverWait(driver, 8, poll_frequency=0.15).until(
+                lambda d: d.find_elements(By.CSS_SELECTOR, "div.g, #rso div[data-ved]")
+            )
+        except Exception:
+            pass  # Fall through to the selector chain - it reports failures
+
+        # Bot-block detection: a blocked page has no results, so without this
+        # check the agent would burn the remaining waits on an interstitial.
+        # Clear cookies and retry once immediately; give up fast if it persists
+        if _is_bot_blocked(driver):
+            print("   🚧 Bot-check interstitial detected - clearing cookies and retrying once...")
+            if search_metadata is not None:
+                search_metadata["bot_blocks"] = search_metadata.get("bot_blocks", 0) + 1
+            driver.delete_all_cookies()
+            time.sleep(random.uniform(1, 2))
+            driver.get(f"https://www.google.com/search?q={urllib.parse.quote_plus(query)}&hl=en")
+            if _is_bot_blocked(driver):
+                print("   ❌ Still blocked - skipping this query")
+                return [], None
+        
+        # Harvest everything browser-side in one round-trip: the JS picks the
+        # first container selector that matches (Google changes these
+        # frequently), walks the containers at native DOM speed and returns
+        # plain dicts - instead of ~15 WebDriver calls per container.
+        # Last run's winning selector goes first so the probe chain usually
+        # succeeds on its first try
+        global _last_good_selector
+        candidates = RESULT_SELECTORS
+        if _last_good_selector and _last_good_selector != candidates[0]:
+            candidates = [_last_good_selector] + [s for s in RESULT_SELECTORS if s != _last_good_selector]
+
+        harvest = driver.execute_script(_HARVEST_JS, candidates)
+        results = harvest.get("results", [])
+        successful_selector = harvest.get("selector")
+        if successful_selector:
+            _last_good_selector = successful_selector
+
+        if successful_selector:
+            print(f"   ✅ Found {len(results)} results with selector: '{successful_selector}'")
+        elif results:
+            print(f"   📍 Found {len(results)} fallback results")
+
         return results, successful_selector
-        
+
     except Exception as e:
         print(f"   ❌ Human-like search failed: {str(e)[:100]}...")
         return [], None
 
 
-def extract_result_data(container, index, query, selector_type):
-    """
-    📝 Extract title, URL, and snippet from a search result container
-    Handles different Google result structures
-    """
-    try:
-        result_data = {
-            "title": "No title",
-            "url": "",
-            "snippet": ""
-        }
-        
-        # Extract title (try multiple approaches)
-        title_selectors = ["h3", ".LC20lb", ".DKV0Md", "[role='heading']"]
-        for title_sel in title_selectors:
-            try:
-                title_elem = container.find_element(By.CSS_SELECTOR, title_sel)
-                if title_elem and title_elem.text.strip():
-                    result_data["title"] = title_elem.text.strip()
-                    break
-            except:
-                continue
-        
-        # Extract URL (try multiple approaches)
-        url_selectors = ["a", ".yuRUbf a", "h3 a", "[data-ved] a"]
-        for url_sel in url_selectors:
-            try:
-                link_elem = container.find_element(By.CSS_SELECTOR, url_sel)
-                href = link_elem.get_attribute("href")
-                if href and href.startswith("http"):
-                    result_data["url"] = href
-                    break
-            except:
-                continue
-        
-        # Extract snippet (try multiple approaches)
-        snippet_selectors = [
-            ".VwiC3b", ".s3v9rd", ".st", "[data-sncf]", 
-            "span", ".IsZvec", ".aCOpRe"
-        ]
-        snippet_texts = []
-        
-        for snippet_sel in snippet_selectors:
-            try:
-                snippet_elems = container.find_elements(By.CSS_SELECTOR, snippet_sel)
-                for elem in snippet_elems[:3]:  # Limit to first 3 elements
-                    text = elem.text.strip()
-                    if text and len(text) > 10:  # Only meaningful text
-                        snippet_texts.append(text)
-            except:
-                continue
-        
-        # Combine snippet texts
-        if snippet_texts:
-            result_data["snippet"] = " ".join(snippet_texts)[:500]  # Limit length
-        
-        # Validation: must have at least title or URL
-        if not result_data["title"] and not result_data["url"]:
-            return None
-            
-        return result_data
-        
-    except Exception as e:
-        print(f"      ⚠️ Failed to extract data from result {index}: {str(e)[:50]}...")
-        return None
+class _DriverStartupError(RuntimeError):
+    """🚫 Chrome could not be launched at all - triggers the sample-data fallback"""
 
 
 def google_search_agent(state: MultiPlatformState) -> MultiPlatformState:
@@ -171,11 +254,13 @@ def google_search_agent(state: MultiPlatformState) -> MultiPlatformState:
     search_query = state["search_query"]
     target_results = state["target_results"]
     
-    # Update state to show we're starting
-    state = log_platform_progress(state,"google", f"🔍 Starting Google search for: '{search_query}'")
+    # Log lines accumulate locally and merge into the state once at return -
+    # each log_platform_progress call would copy the entire state dict
+    progress_entries = [format_progress_entry("google", f"🔍 Starting Google search for: '{search_query}'")]
+    error_entries = []
     
-    # Generate search queries
-    search_queries = get_search_queries(search_query)
+    # Generate search queries (deduplicated, order preserved)
+    search_queries = tuple(dict.fromkeys(get_search_queries(search_query)))
     print(f"📋 Search strategy: {len(search_queries)} query variations")
     
     all_results = []
@@ -192,70 +277,102 @@ def google_search_agent(state: MultiPlatformState) -> MultiPlatformState:
     chrome_options = Options()
     for option in CHROME_OPTIONS:
         chrome_options.add_argument(option)
+
+    # Return from driver.get at DOMContentLoaded instead of waiting for every
+    # late-loading ad/analytics sub-resource (results text is in the DOM)
+    chrome_options.page_load_strategy = 'eager'
     
     # Additional stealth options
     chrome_options.add_argument('--disable-blink-features=AutomationControlled')
+    chrome_options.add_argument('--blink-settings=imagesEnabled=false')
+
+    # Persistent profile: cookies survive across runs, which reduces Google's
+    # "unusual traffic" challenges for repeat investigations
+    chrome_options.add_argument(f"--user-data-dir={os.path.join(tempfile.gettempdir(), 'atomberg-chrome-profile')}")
     chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
     chrome_options.add_experimental_option('useAutomationExtension', False)
     
     try:
         start_time = time.time()
-        
-        # Initialize driver with webdriver-manager
-        driver = webdriver.Chrome(
-            service=webdriver.chrome.service.Service(ChromeDriverManager().install()),
-            options=chrome_options
-        )
-        
-        # Additional stealth measures
-        driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-        
-        print("🤖 Chrome browser initialized (stealth mode)")
-        
-        # Random delay before starting (humans don't search immediately)
-        time.sleep(random.uniform(1, 3))
-        
+
+        # Browser starts lazily: if every query is served from the SERP
+        # cache, Chrome never launches at all
+        driver = None
+
         for i, query in enumerate(search_queries):
             print(f"🔎 Executing search {i+1}/{len(search_queries)}: '{query}'")
-            
+
             try:
-                # Use human-like search behavior
-                result_containers, successful_selector = perform_human_like_search(driver, query)
-                
+                cached = _serp_cache_get(query)
+                if cached is not None:
+                    extracted_results, successful_selector = cached
+                    fetched_live = False
+                    print(f"   💾 SERP cache hit - {len(extracted_results)} results, no browser traffic")
+                else:
+                    if driver is None:
+                        # Initialize driver (chromedriver path cached per process)
+                        try:
+                            driver = webdriver.Chrome(
+                                service=webdriver.chrome.service.Service(_get_chromedriver_path()),
+                                options=chrome_options
+                            )
+                        except Exception as launch_error:
+                            # No browser at all - every query would fail the
+                            # same way, so surface this to the outer handler
+                            # and its sample-data fallback
+                            raise _DriverStartupError(str(launch_error)) from launch_error
+
+                        # Additional stealth measures
+                        driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+
+                        # Block images/fonts/CSS/analytics - the extractor only reads text
+                        try:
+                            driver.execute_cdp_cmd("Network.enable", {})
+                            driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": _BLOCKED_URL_PATTERNS})
+                            print("🚫 Resource blocking enabled (images/fonts/css/trackers)")
+                        except Exception:
+                            # CDP not available (e.g. remote driver) - pages just load heavier
+                            pass
+
+                        print("🤖 Chrome browser initialized (stealth mode)")
+
+                        # Random delay before starting (humans don't search immediately)
+                        time.sleep(random.uniform(1, 3))
+
+                    # Use human-like search behavior (returns harvested dicts)
+                    extracted_results, successful_selector = perform_human_like_search(driver, query, search_metadata)
+                    fetched_live = True
+
+                    if extracted_results:
+                        _serp_cache_put(query, extracted_results, successful_selector)
+
                 if successful_selector:
                     search_metadata["selectors_used"].append(successful_selector)
-                
-                print(f"   📊 Found {len(result_containers)} result containers")
-                
+
+                print(f"   📊 Found {len(extracted_results)} extracted results")
+
                 query_results = []
-                
-                # Extract information from each result
-                for j, container in enumerate(result_containers[:SEARCH_CONFIG['target_results_per_query']]):
-                    
-                    # Extract result data
-                    result_data = extract_result_data(container, j, query, successful_selector)
-                    
-                    if result_data:
-                        # Create result object
-                        result = {
-                            "id": f"google_{i}_{j}",
-                            "title": result_data["title"],
-                            "url": result_data["url"],
-                            "snippet": result_data["snippet"],
-                            "search_query": query,
-                            "position": j + 1,  # Search result position
-                            "timestamp": datetime.now().isoformat(),
-                            "source": "google",
-                            "selector_used": successful_selector
-                        }
-                        
-                        query_results.append(result)
-                        
-                        # Human-like pause between extractions
-                        if j % 5 == 0 and j > 0:
-                            time.sleep(random.uniform(0.5, 1.0))
-                    else:
-                        search_metadata["errors_encountered"] += 1
+
+                # One timestamp per query batch - results arrive together,
+                # and this keeps datetime.now() out of the packaging loop
+                batch_timestamp = datetime.now().isoformat()
+
+                # Package the harvested results (extraction already happened
+                # in-page, so this loop is pure dict building)
+                for j, result_data in enumerate(extracted_results[:SEARCH_CONFIG['target_results_per_query']]):
+                    result = {
+                        "id": f"google_{i}_{j}",
+                        "title": result_data["title"],
+                        "url": result_data["url"],
+                        "snippet": result_data["snippet"],
+                        "search_query": query,
+                        "position": j + 1,  # Search result position
+                        "timestamp": batch_timestamp,
+                        "source": "google",
+                        "selector_used": successful_selector
+                    }
+
+                    query_results.append(result)
                 
                 all_results.extend(query_results)
                 search_metadata["queries_executed"].append(query)
@@ -263,21 +380,27 @@ def google_search_agent(state: MultiPlatformState) -> MultiPlatformState:
                 
                 print(f"   ✅ Collected {len(query_results)} results for this query")
                 
-                # Human-like delay between searches (very important!)
-                if i < len(search_queries) - 1:  # Don't delay after last search
+                # Human-like delay between searches (very important!) -
+                # skipped after cache hits since no traffic was generated
+                if fetched_live and i < len(search_queries) - 1:  # Don't delay after last search
                     delay = random.uniform(8, 15)  # Longer delay between searches
                     print(f"   ⏸️  Pausing for {delay:.1f}s before next search...")
                     time.sleep(delay)
                 
+            except _DriverStartupError:
+                raise
             except Exception as e:
                 error_msg = f"Enhanced search failed for query '{query}': {str(e)}"
                 print(f"   ❌ {error_msg}")
-                state = log_error(state, error_msg, "Continuing with next query")
+                error_entry = format_error_entry(error_msg, "Continuing with next query")
+                error_entries.append(error_entry)
+                progress_entries.append(error_entry)  # Errors appear in both logs
                 search_metadata["errors_encountered"] += 1
                 continue
         
-        # Clean up
-        driver.quit()
+        # Clean up (driver stays None when everything came from cache)
+        if driver is not None:
+            driver.quit()
         end_time = time.time()
         search_metadata["total_time_seconds"] = round(end_time - start_time, 2)
         
@@ -289,16 +412,18 @@ def google_search_agent(state: MultiPlatformState) -> MultiPlatformState:
             print("⚠️ Low result count - possible bot detection")
             print("🔄 Consider using sample data fallback for development")
         
-        # Update state with results
-        state = log_platform_progress(state,"google", f"🔍 Enhanced Google search completed: {len(all_results)} results from {len(search_queries)} queries")
-        
+        # Update state with results (single state copy for the whole agent)
+        progress_entries.append(format_progress_entry("google", f"🔍 Enhanced Google search completed: {len(all_results)} results from {len(search_queries)} queries"))
+
         return {
             **state,
+            "investigation_log": state["investigation_log"] + progress_entries,
+            "errors_log": state.get("errors_log", []) + error_entries,
             "raw_search_results": all_results,
             "search_metadata": search_metadata,
             "current_phase": "data_collection_complete"
         }
-        
+
     except Exception as e:
         error_msg = f"Critical enhanced search failure: {str(e)}"
         print(f"❌ {error_msg}")
@@ -315,67 +440,76 @@ def google_search_agent(state: MultiPlatformState) -> MultiPlatformState:
         
         return {
             **state,
+            "investigation_log": state["investigation_log"] + progress_entries,
+            "errors_log": state.get("errors_log", []) + error_entries,
             "raw_search_results": sample_results,
             "search_metadata": {"sample_data": True, "fallback_reason": error_msg},
             "current_phase": "data_collection_complete"
         }
 
 
+# Static portion of the sample-data fallback, built once at import; only
+# search_query and timestamp vary per call. Each entry maps to a query
+# variation index with a default when fewer queries exist
+_SAMPLE_QUERY_SLOTS = ((0, "smart fan review"), (1, "smart fan comparison"),
+                       (0, "smart fan review"), (2, "smart fan best brand"),
+                       (0, "smart fan review"))
+_SAMPLE_BASE = (
+    {
+        "id": "sample_1",
+        "title": "Atomberg Efficio Plus 1200mm BLDC Motor Ceiling Fan Review",
+        "url": "https://www.amazon.in/dp/B07PQZXYZ/",
+        "snippet": "Atomberg Efficio Plus smart ceiling fan with BLDC motor offers 65% energy savings compared to traditional fans. Features remote control, app connectivity and 3-year warranty. Customer rating: 4.3/5 stars from 2,847 reviews.",
+        "position": 1,
+        "source": "google_sample"
+    },
+    {
+        "id": "sample_2",
+        "title": "Best Smart Ceiling Fans in India 2024: Atomberg, Havells, Bajaj Comparison",
+        "url": "https://www.gadgets360.com/home-appliances/features/best-smart-ceiling-fans",
+        "snippet": "Comprehensive comparison of smart ceiling fans available in India. Atomberg leads in energy efficiency with BLDC technology. Havells offers premium designer options. Bajaj provides budget-friendly smart fans with basic app control.",
+        "position": 2,
+        "source": "google_sample"
+    },
+    {
+        "id": "sample_3",
+        "title": "Havells Stealth Air 1200mm Smart Ceiling Fan with Remote - Latest Model",
+        "url": "https://www.flipkart.com/havells-stealth-air-smart-fan",
+        "snippet": "Havells introduces new Stealth Air smart ceiling fan series with aerodynamic design and remote control. Features reversible motor and LED lighting. Available in multiple finishes for modern homes.",
+        "position": 3,
+        "source": "google_sample"
+    },
+    {
+        "id": "sample_4",
+        "title": "Bajaj Maxima 1200mm Ceiling Fan vs Smart Alternatives - Price Comparison",
+        "url": "https://www.indianexpress.com/article/technology/reviews/bajaj-smart-fans",
+        "snippet": "Bajaj Electricals launches smart ceiling fan range to compete with Atomberg and Havells. Offers app-based speed control and timer functions at competitive pricing. Good build quality with 2-year warranty.",
+        "position": 4,
+        "source": "google_sample"
+    },
+    {
+        "id": "sample_5",
+        "title": "Crompton HS Plus Smart Fan Review - Energy Efficient BLDC Motor",
+        "url": "https://www.digit.in/reviews/home-appliances/crompton-smart-fan-review",
+        "snippet": "Crompton HS Plus smart ceiling fan review reveals excellent energy efficiency and build quality. BLDC motor ensures silent operation. Mobile app allows speed control and scheduling features.",
+        "position": 5,
+        "source": "google_sample"
+    }
+)
+
+
 def create_sample_data(search_queries):
     """
     🧪 High-quality sample data for testing when Google scraping fails
     """
+    timestamp = datetime.now().isoformat()
     return [
         {
-            "id": "sample_1",
-            "title": "Atomberg Efficio Plus 1200mm BLDC Motor Ceiling Fan Review",
-            "url": "https://www.amazon.in/dp/B07PQZXYZ/",
-            "snippet": "Atomberg Efficio Plus smart ceiling fan with BLDC motor offers 65% energy savings compared to traditional fans. Features remote control, app connectivity and 3-year warranty. Customer rating: 4.3/5 stars from 2,847 reviews.",
-            "search_query": search_queries[0] if search_queries else "smart fan review",
-            "position": 1,
-            "timestamp": datetime.now().isoformat(),
-            "source": "google_sample"
-        },
-        {
-            "id": "sample_2",
-            "title": "Best Smart Ceiling Fans in India 2024: Atomberg, Havells, Bajaj Comparison",
-            "url": "https://www.gadgets360.com/home-appliances/features/best-smart-ceiling-fans",
-            "snippet": "Comprehensive comparison of smart ceiling fans available in India. Atomberg leads in energy efficiency with BLDC technology. Havells offers premium designer options. Bajaj provides budget-friendly smart fans with basic app control.",
-            "search_query": search_queries[1] if len(search_queries) > 1 else "smart fan comparison",
-            "position": 2,
-            "timestamp": datetime.now().isoformat(),
-            "source": "google_sample"
-        },
-        {
-            "id": "sample_3",
-            "title": "Havells Stealth Air 1200mm Smart Ceiling Fan with Remote - Latest Model",
-            "url": "https://www.flipkart.com/havells-stealth-air-smart-fan",
-            "snippet": "Havells introduces new Stealth Air smart ceiling fan series with aerodynamic design and remote control. Features reversible motor and LED lighting. Available in multiple finishes for modern homes.",
-            "search_query": search_queries[0] if search_queries else "smart fan review",
-            "position": 3,
-            "timestamp": datetime.now().isoformat(),
-            "source": "google_sample"
-        },
-        {
-            "id": "sample_4",
-            "title": "Bajaj Maxima 1200mm Ceiling Fan vs Smart Alternatives - Price Comparison",
-            "url": "https://www.indianexpress.com/article/technology/reviews/bajaj-smart-fans",
-            "snippet": "Bajaj Electricals launches smart ceiling fan range to compete with Atomberg and Havells. Offers app-based speed control and timer functions at competitive pricing. Good build quality with 2-year warranty.",
-            "search_query": search_queries[2] if len(search_queries) > 2 else "smart fan best brand",
-            "position": 4,
-            "timestamp": datetime.now().isoformat(),
-            "source": "google_sample"
-        },
-        {
-            "id": "sample_5",
-            "title": "Crompton HS Plus Smart Fan Review - Energy Efficient BLDC Motor",
-            "url": "https://www.digit.in/reviews/home-appliances/crompton-smart-fan-review",
-            "snippet": "Crompton HS Plus smart ceiling fan review reveals excellent energy efficiency and build quality. BLDC motor ensures silent operation. Mobile app allows speed control and scheduling features.",
-            "search_query": search_queries[0] if search_queries else "smart fan review",
-            "position": 5,
-            "timestamp": datetime.now().isoformat(),
-            "source": "google_sample"
+            **base,
+            "search_query": search_queries[slot] if len(search_queries) > slot else fallback,
+            "timestamp": timestamp
         }
+        for base, (slot, fallback) in zip(_SAMPLE_BASE, _SAMPLE_QUERY_SLOTS)
     ]
 
 
@@ -3,25 +3,61 @@
 Specialized in gathering video content and engagement data
 """
 
-from googleapiclient.discovery import build
-from googleapiclient.errors import HttpError
+import numpy as np
+import re
 import time
 import random
 from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Tuple
 
-from ..core.detective_state import MultiPlatformState, log_platform_progress
+from ..core.detective_state import MultiPlatformState, format_progress_entry
 from ..config.youtube_config import (
     get_youtube_api_key, YOUTUBE_CONFIG, VIDEO_ENGAGEMENT_FACTORS, COMMENT_ANALYSIS
 )
 from config import get_search_queries
 
+# googleapiclient (and its httplib2/discovery machinery) is heavy; it is
+# imported on first collector construction so Google-only runs that never
+# touch YouTube skip the cost entirely
+build = None
+HttpError = None
+
+def _load_api_client():
+    """📦 Bind the googleapiclient entry points lazily (once per process)"""
+    global build, HttpError
+    if build is None:
+        from googleapiclient.discovery import build as _build
+        from googleapiclient.errors import HttpError as _HttpError
+        build = _build
+        HttpError = _HttpError
+
+# Stats caches shared across collector instances: the same video/channel ids
+# recur across query variations and repeat runs in one process, and every
+# avoided videos()/channels() call also saves quota
+_VIDEO_STATS_CACHE: Dict[str, Dict] = {}
+_CHANNEL_STATS_CACHE: Dict[str, Dict] = {}
+
+# All spam indicators fused into one compiled alternation - a single scan per
+# comment instead of one substring search per indicator, case-folded by the
+# regex engine rather than a per-comment .lower() allocation
+_SPAM_RE = re.compile(
+    '|'.join(re.escape(indicator) for indicator in COMMENT_ANALYSIS["skip_spam_indicators"]),
+    re.IGNORECASE
+)
+
+# Scoring weights bound once at import for the vectorized kernels
+_VIEW_W = VIDEO_ENGAGEMENT_FACTORS["view_count_weight"]
+_LIKE_W = VIDEO_ENGAGEMENT_FACTORS["like_count_weight"]
+_COMMENT_W = VIDEO_ENGAGEMENT_FACTORS["comment_count_weight"]
+
 class YouTubeIntelligenceCollector:
     """
     🎥 YouTube Data Collection and Analysis Engine
     """
     
     def __init__(self):
+        _load_api_client()
         self.api_key = get_youtube_api_key()
         self.youtube = build(
             YOUTUBE_CONFIG["api_service_name"],
@@ -41,8 +77,10 @@ class YouTubeIntelligenceCollector:
         search_query = state["search_query"]
         youtube_config = state["platform_configs"].get("youtube", {})
         
-        state = log_platform_progress(state, "youtube", f"Starting intelligence collection for: '{search_query}'")
-        
+        # Progress entries accumulate locally and merge into the state once
+        # at return - each log_platform_progress call copies the full state
+        progress_entries = [format_progress_entry("youtube", f"Starting intelligence collection for: '{search_query}'")]
+
         try:
             start_time = time.time()
             
@@ -50,43 +88,39 @@ class YouTubeIntelligenceCollector:
             search_queries = self.generate_youtube_queries(search_query)
             print(f"🔍 YouTube search strategy: {len(search_queries)} specialized queries")
             
-            all_videos = []
-            all_comments = []
-            channel_data = {}
-            
-            # Collect videos for each query
+            # Phase 1: run all searches, then dedupe videos across queries -
+            # query variations overlap heavily, and each duplicate dropped
+            # here saves detail/comment/channel requests downstream
+            all_search_videos = []
             for i, query in enumerate(search_queries):
                 print(f"🎬 Executing YouTube search {i+1}/{len(search_queries)}: '{query}'")
-                
-                # Search for videos
+
                 videos = self.search_videos(query, max_results=youtube_config.get("target_videos", 25))
-                
+
                 if videos:
                     print(f"   📺 Found {len(videos)} videos")
-                    
-                    # Get detailed video information
-                    detailed_videos = self.get_video_details(videos)
-                    
-                    # Collect comments for each video
-                    video_comments = self.collect_video_comments(
-                        detailed_videos, 
-                        max_per_video=youtube_config.get("target_comments_per_video", 20)
-                    )
-                    
-                    # Analyze channels
-                    video_channels = self.analyze_video_channels(detailed_videos)
-                    
-                    all_videos.extend(detailed_videos)
-                    all_comments.extend(video_comments)
-                    channel_data.update(video_channels)
-                    
-                    print(f"   ✅ Collected {len(detailed_videos)} videos, {len(video_comments)} comments")
-                
+                    all_search_videos.extend(videos)
+
                 # Respectful delay between searches
                 if i < len(search_queries) - 1:
                     delay = random.uniform(2, 4)
                     print(f"   ⏸️  YouTube API pause: {delay:.1f}s")
                     time.sleep(delay)
+
+            unique_videos = list({v["video_id"]: v for v in all_search_videos}.values())
+            if len(unique_videos) < len(all_search_videos):
+                print(f"   ♻️ Deduplicated {len(all_search_videos) - len(unique_videos)} videos shared across queries")
+
+            # Phase 2: one batched pipeline over the unique videos
+            all_videos = self.get_video_details(unique_videos)
+            all_comments = self.collect_video_comments(
+                all_videos,
+                max_per_video=youtube_config.get("target_comments_per_video", 20)
+            )
+            channel_data = self.analyze_video_channels(all_videos)
+
+            if all_videos:
+                print(f"   ✅ Collected {len(all_videos)} videos, {len(all_comments)} comments")
             
             end_time = time.time()
             
@@ -104,28 +138,31 @@ class YouTubeIntelligenceCollector:
             print(f"🏁 YouTube collection completed in {youtube_metadata['collection_time_seconds']}s")
             print(f"📊 Total YouTube data: {len(all_videos)} videos, {len(all_comments)} comments")
             
-            # Update state with YouTube results
-            state = log_platform_progress(
-                state, 
-                "youtube", 
+            progress_entries.append(format_progress_entry(
+                "youtube",
                 f"Collection completed: {len(all_videos)} videos, {len(all_comments)} comments"
-            )
-            
+            ))
+
+            # Combine in place for unified processing - no second list copy
+            all_videos.extend(all_comments)
+
             return {
                 **state,
-                "youtube_results": all_videos + all_comments,  # Combined for unified processing
+                "investigation_log": state["investigation_log"] + progress_entries,
+                "youtube_results": all_videos,
                 "youtube_metadata": youtube_metadata,
                 "youtube_channels": channel_data,
                 "current_phase": "youtube_collection_complete"
             }
-            
+
         except Exception as e:
             error_msg = f"YouTube collection failed: {str(e)}"
             print(f"❌ {error_msg}")
-            
+
             # Return state with error but continue processing
             return {
                 **state,
+                "investigation_log": state["investigation_log"] + progress_entries,
                 "youtube_results": [],
                 "youtube_metadata": {"error": error_msg, "fallback_used": True},
                 "errors_log": state["errors_log"] + [error_msg]
@@ -133,24 +170,9 @@ class YouTubeIntelligenceCollector:
     
     def generate_youtube_queries(self, base_query: str) -> List[str]:
         """
-        🎯 Generate YouTube-optimized search queries
+        🎯 Generate YouTube-optimized search queries (cached per base query)
         """
-        
-        # Start with base queries
-        queries = get_search_queries(base_query)
-        
-        # Add YouTube-specific variations
-        youtube_specific = [
-            f"{base_query} review 2024",
-            f"{base_query} comparison test",
-            f"{base_query} installation guide",
-            f"best {base_query} India"
-        ]
-        
-        # Combine and deduplicate
-        all_queries = list(set(queries + youtube_specific))
-        
-        return all_queries[:3]  # Limit to 3 for API quota management
+        return list(_generate_youtube_queries(base_query))
     
     def search_videos(self, query: str, max_results: int = 25) -> List[Dict]:
         """
@@ -164,7 +186,13 @@ class YouTubeIntelligenceCollector:
                 type="video",
                 maxResults=min(max_results, 50),  # API limit is 50
                 order=YOUTUBE_CONFIG["search_order"],
-                publishedAfter=(datetime.now() - timedelta(days=365)).isoformat() + 'Z'  # Last year only
+                # Last year only, rounded to the day boundary so repeated
+                # runs within a day issue byte-identical requests
+                publishedAfter=(datetime.now() - timedelta(days=365)).replace(
+                    hour=0, minute=0, second=0, microsecond=0
+                ).isoformat() + 'Z',
+                # Partial response: only the fields the parse loop reads
+                fields="items(id/videoId,snippet(title,description,channelId,channelTitle,publishedAt,thumbnails/medium/url))"
             )
             
             response = request.execute()
@@ -173,19 +201,21 @@ class YouTubeIntelligenceCollector:
             
             videos = []
             for item in response.get('items', []):
+                # Bind the snippet once instead of re-indexing it per field
+                snippet = item['snippet']
                 video = {
                     "type": "video",
                     "video_id": item['id']['videoId'],
-                    "title": item['snippet']['title'],
-                    "description": item['snippet']['description'],
-                    "channel_id": item['snippet']['channelId'],
-                    "channel_title": item['snippet']['channelTitle'],
-                    "published_at": item['snippet']['publishedAt'],
-                    "thumbnail": item['snippet']['thumbnails'].get('medium', {}).get('url', ''),
+                    "title": snippet['title'],
+                    "description": snippet['description'],
+                    "channel_id": snippet['channelId'],
+                    "channel_title": snippet['channelTitle'],
+                    "published_at": snippet['publishedAt'],
+                    "thumbnail": snippet['thumbnails'].get('medium', {}).get('url', ''),
                     "search_query": query
                 }
                 videos.append(video)
-            
+
             return videos
             
         except HttpError as e:
@@ -199,35 +229,53 @@ class YouTubeIntelligenceCollector:
         
         if not videos:
             return []
-        
+
         video_ids = [v["video_id"] for v in videos]
-        
+
         try:
-            # Get statistics for all videos in batch
-            request = self.youtube.videos().list(
-                part="statistics,contentDetails",
-                id=','.join(video_ids)
-            )
-            
-            response = request.execute()
-            self.requests_made += 1
-            self.daily_quota_used += 1  # Videos.list costs 1 quota unit
-            
-            # Create lookup dictionary
-            stats_lookup = {}
-            for item in response.get('items', []):
-                video_id = item['id']
-                stats = item['statistics']
-                content_details = item['contentDetails']
-                
-                stats_lookup[video_id] = {
-                    "view_count": int(stats.get('viewCount', 0)),
-                    "like_count": int(stats.get('likeCount', 0)),
-                    "comment_count": int(stats.get('commentCount', 0)),
-                    "duration": content_details.get('duration', ''),
-                    "engagement_score": self.calculate_video_engagement_score(stats)
-                }
-            
+            # Serve already-fetched videos from the cache; only misses go to
+            # the API
+            stats_lookup = {vid: _VIDEO_STATS_CACHE[vid] for vid in video_ids if vid in _VIDEO_STATS_CACHE}
+            missing_ids = [vid for vid in video_ids if vid not in stats_lookup]
+
+            # Get statistics for the uncached videos, batched at the API's
+            # 50-id ceiling (deduped cross-query sets can exceed it)
+            for chunk_start in range(0, len(missing_ids), 50):
+                request = self.youtube.videos().list(
+                    part="statistics,contentDetails",
+                    id=','.join(missing_ids[chunk_start:chunk_start + 50]),
+                    fields="items(id,statistics(viewCount,likeCount,commentCount),contentDetails/duration)"
+                )
+
+                response = request.execute()
+                self.requests_made += 1
+                self.daily_quota_used += 1  # Videos.list costs 1 quota unit
+
+                items = response.get('items', [])
+
+                # Engagement scores for the whole chunk in one vector
+                # expression (same formula as calculate_video_engagement_score)
+                item_count = len(items)
+                stat_dicts = [item['statistics'] for item in items]
+                views = np.fromiter((int(stats.get('viewCount', 0)) for stats in stat_dicts), dtype=np.int64, count=item_count)
+                likes = np.fromiter((int(stats.get('likeCount', 0)) for stats in stat_dicts), dtype=np.int64, count=item_count)
+                comments = np.fromiter((int(stats.get('commentCount', 0)) for stats in stat_dicts), dtype=np.int64, count=item_count)
+                engagement = np.where(
+                    views == 0, 0.0,
+                    np.round(np.sqrt(views) * _VIEW_W + likes * (10 * _LIKE_W) + comments * (50 * _COMMENT_W), 2)
+                )
+
+                for index, item in enumerate(items):
+                    video_stats = {
+                        "view_count": int(views[index]),
+                        "like_count": int(likes[index]),
+                        "comment_count": int(comments[index]),
+                        "duration": item['contentDetails'].get('duration', ''),
+                        "engagement_score": float(engagement[index])
+                    }
+                    stats_lookup[item['id']] = video_stats
+                    _VIDEO_STATS_CACHE[item['id']] = video_stats
+
             # Merge with original video data
             enhanced_videos = []
             for video in videos:
@@ -280,32 +328,18 @@ class YouTubeIntelligenceCollector:
                     part="snippet",
                     videoId=video["video_id"],
                     maxResults=max_per_video,
-                    order="relevance"  # Get most relevant comments first
+                    order="relevance",  # Get most relevant comments first
+                    fields="items/snippet/topLevelComment(id,snippet(textDisplay,likeCount,publishedAt,authorDisplayName))"
                 )
                 
                 response = request.execute()
                 self.requests_made += 1
                 self.daily_quota_used += 1
-                
-                for item in response.get('items', []):
-                    comment_snippet = item['snippet']['topLevelComment']['snippet']
-                    
-                    comment = {
-                        "type": "comment",
-                        "comment_id": item['snippet']['topLevelComment']['id'],
-                        "video_id": video["video_id"],
-                        "video_title": video["title"],
-                        "text": comment_snippet['textDisplay'],
-                        "like_count": comment_snippet.get('likeCount', 0),
-                        "published_at": comment_snippet['publishedAt'],
-                        "author": comment_snippet['authorDisplayName'],
-                        "search_query": video.get("search_query", "")
-                    }
-                    
-                    # Filter out spam and very short comments
-                    if self.is_valid_comment(comment):
-                        all_comments.append(comment)
-                
+
+                # Generator pipeline: parse lazily, filter spam/short
+                # comments, extend once per video (no intermediate list)
+                all_comments.extend(filter(self.is_valid_comment, self._parse_comments(response, video)))
+
                 # Small delay between comment requests
                 time.sleep(0.5)
                 
@@ -315,23 +349,41 @@ class YouTubeIntelligenceCollector:
                 continue
         
         return all_comments
-    
+
+    def _parse_comments(self, response: Dict, video: Dict):
+        """💬 Yield parsed comment dicts from a commentThreads response"""
+
+        for item in response.get('items', []):
+            top_level = item['snippet']['topLevelComment']
+            comment_snippet = top_level['snippet']
+
+            yield {
+                "type": "comment",
+                "comment_id": top_level['id'],
+                "video_id": video["video_id"],
+                "video_title": video["title"],
+                "text": comment_snippet['textDisplay'],
+                "like_count": comment_snippet.get('likeCount', 0),
+                "published_at": comment_snippet['publishedAt'],
+                "author": comment_snippet['authorDisplayName'],
+                "search_query": video.get("search_query", "")
+            }
+
     def is_valid_comment(self, comment: Dict) -> bool:
         """Filter out spam and low-quality comments"""
-        
-        text = comment["text"].lower()
-        
+
+        text = comment["text"]
+
         # Skip very short or very long comments
         if len(text) < COMMENT_ANALYSIS["min_comment_length"]:
             return False
         if len(text) > COMMENT_ANALYSIS["max_comment_length"]:
             return False
-        
-        # Skip obvious spam
-        for spam_indicator in COMMENT_ANALYSIS["skip_spam_indicators"]:
-            if spam_indicator in text:
-                return False
-        
+
+        # Skip obvious spam (one pass over all indicators)
+        if _SPAM_RE.search(text):
+            return False
+
         return True
     
     def analyze_video_channels(self, videos: List[Dict]) -> Dict[str, Dict]:
@@ -340,36 +392,62 @@ class YouTubeIntelligenceCollector:
         """
         
         channel_ids = list(set([v["channel_id"] for v in videos]))
-        channel_data = {}
-        
+
+        # Cached channels skip the API entirely
+        channel_data = {cid: _CHANNEL_STATS_CACHE[cid] for cid in channel_ids if cid in _CHANNEL_STATS_CACHE}
+        missing_ids = [cid for cid in channel_ids if cid not in channel_data]
+
+        if not missing_ids:
+            return channel_data
+
         try:
-            # Get channel statistics
-            request = self.youtube.channels().list(
-                part="statistics,snippet",
-                id=','.join(channel_ids[:50])  # API limit
-            )
-            
-            response = request.execute()
-            self.requests_made += 1
-            self.daily_quota_used += 1
-            
-            for item in response.get('items', []):
-                channel_id = item['id']
-                stats = item['statistics']
-                snippet = item['snippet']
-                
-                channel_data[channel_id] = {
-                    "channel_title": snippet['title'],
-                    "subscriber_count": int(stats.get('subscriberCount', 0)),
-                    "video_count": int(stats.get('videoCount', 0)),
-                    "view_count": int(stats.get('viewCount', 0)),
-                    "description": snippet.get('description', ''),
-                    "influence_score": self.calculate_influence_score(stats)
-                }
-        
+            # Get channel statistics for the uncached ids, batched at the
+            # API's 50-id ceiling instead of silently truncating
+            for chunk_start in range(0, len(missing_ids), 50):
+                request = self.youtube.channels().list(
+                    part="statistics,snippet",
+                    id=','.join(missing_ids[chunk_start:chunk_start + 50]),
+                    fields="items(id,snippet(title,description),statistics(subscriberCount,videoCount,viewCount))"
+                )
+
+                response = request.execute()
+                self.requests_made += 1
+                self.daily_quota_used += 1
+
+                items = response.get('items', [])
+
+                # Influence scores for the whole chunk in one vector
+                # expression (same formula as calculate_influence_score)
+                item_count = len(items)
+                stat_dicts = [item['statistics'] for item in items]
+                subs = np.fromiter((int(stats.get('subscriberCount', 0)) for stats in stat_dicts), dtype=np.int64, count=item_count)
+                vids = np.fromiter((int(stats.get('videoCount', 0)) for stats in stat_dicts), dtype=np.int64, count=item_count)
+                total_views = np.fromiter((int(stats.get('viewCount', 0)) for stats in stat_dicts), dtype=np.int64, count=item_count)
+                avg_views = np.where(vids > 0, total_views / np.maximum(vids, 1), 0.0)
+                engagement_rate = np.where(subs > 0, avg_views / np.maximum(subs, 1), 0.0)
+                influence = np.where(
+                    subs == 0, 0.0,
+                    np.round(subs ** 0.3 * (engagement_rate * 1000), 2)
+                )
+
+                for index, item in enumerate(items):
+                    channel_id = item['id']
+                    snippet = item['snippet']
+
+                    channel_stats = {
+                        "channel_title": snippet['title'],
+                        "subscriber_count": int(subs[index]),
+                        "video_count": int(vids[index]),
+                        "view_count": int(total_views[index]),
+                        "description": snippet.get('description', ''),
+                        "influence_score": float(influence[index])
+                    }
+                    channel_data[channel_id] = channel_stats
+                    _CHANNEL_STATS_CACHE[channel_id] = channel_stats
+
         except HttpError as e:
             print(f"   ⚠️ Could not get channel data: {e}")
-        
+
         return channel_data
     
     def calculate_influence_score(self, stats: Dict) -> float:
@@ -393,6 +471,29 @@ class YouTubeIntelligenceCollector:
         
         return round(influence_score, 2)
 
+@lru_cache(maxsize=128)
+def _generate_youtube_queries(base_query: str) -> Tuple[str, ...]:
+    """Build the query set once per base query - free on repeat invocations"""
+
+    # Start with base queries
+    queries = get_search_queries(base_query)
+
+    # Add YouTube-specific variations
+    youtube_specific = (
+        f"{base_query} review 2024",
+        f"{base_query} comparison test",
+        f"{base_query} installation guide",
+        f"best {base_query} India"
+    )
+
+    # Ordered dedupe (dict.fromkeys): set() ordering made the [:3] slice -
+    # and therefore quota spend - vary between runs
+    all_queries = tuple(dict.fromkeys(queries + youtube_specific))
+
+    return all_queries[:3]  # Limit to 3 for API quota management
+
+_collector: Optional[YouTubeIntelligenceCollector] = None
+
 def youtube_intelligence_agent(state: MultiPlatformState) -> MultiPlatformState:
     """
     🎥 YouTube Intelligence Agent - Main Entry Point
@@ -402,8 +503,13 @@ def youtube_intelligence_agent(state: MultiPlatformState) -> MultiPlatformState:
     if "youtube" not in state.get("enabled_platforms", []):
         print("⏭️ YouTube collection skipped - not enabled")
         return state
-    
-    collector = YouTubeIntelligenceCollector()
-    return collector.collect_youtube_intelligence(state)
+
+    # One collector per process: the discovery client (and its underlying
+    # HTTP connection) is rebuilt only on the first invocation, and quota
+    # counters accumulate across workflow runs
+    global _collector
+    if _collector is None:
+        _collector = YouTubeIntelligenceCollector()
+    return _collector.collect_youtube_intelligence(state)
 
 print("🎥 YouTube Intelligence Collector Ready!")
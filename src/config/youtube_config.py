@@ -5,10 +5,10 @@ Secure API key management using environment variables
 
 import os
 from typing import Dict, List
-from dotenv import load_dotenv
 
-# Load environment variables from .env file
-load_dotenv()
+# .env loading is deferred to the first API-key lookup so importing this
+# module (e.g. for the config dicts) does no filesystem I/O
+_dotenv_loaded = False
 
 # YouTube API Configuration
 YOUTUBE_CONFIG = {
@@ -44,6 +44,12 @@ def get_youtube_api_key():
     """
     🔑 Get YouTube API key from .env file
     """
+    global _dotenv_loaded
+    if not _dotenv_loaded:
+        from dotenv import load_dotenv
+        load_dotenv()
+        _dotenv_loaded = True
+
     api_key = os.getenv("YOUTUBE_API_KEY")
     
     if not api_key:
@@ -5,17 +5,30 @@ Maintains backward compatibility while adding multi-platform orchestration
 
 from langgraph.graph import StateGraph, END
 from ..core.detective_state import MultiPlatformState, create_multiplatform_state
-from ..core.platform_orchestrator import platform_orchestration_agent
-from ..analyzers.quantitative_analyzer import quantitative_analysis_agent  
-from ..analyzers.sov_calculator import sov_calculation_agent
-from ..analyzers.competitive_scoring_analyzer import competitive_scoring_agent
+from collections import Counter
+from functools import lru_cache
 from typing import List
 
+# Static recommendation text hoisted to module scope - reused across
+# invocations instead of re-allocated per call
+_LOW_PRESENCE_REC = "Increase market presence through content marketing"
+_LOW_ENGAGEMENT_REC = "Improve content quality to enhance engagement"
+
+@lru_cache(maxsize=1)
 def create_multiplatform_workflow() -> StateGraph:
     """
     🏢 Create Enhanced Detective Agency Workflow with Competitive Intelligence
+    (compiled once - the graph is static, so repeat investigations reuse it)
     """
-    
+
+    # Agent modules pull in the collector stacks (Selenium, API clients,
+    # pandas); importing them here - inside the cached factory - keeps
+    # them off the cold import path and loads them once per process
+    from ..core.platform_orchestrator import platform_orchestration_agent
+    from ..analyzers.quantitative_analyzer import quantitative_analysis_agent
+    from ..analyzers.sov_calculator import sov_calculation_agent
+    from ..analyzers.competitive_scoring_analyzer import competitive_scoring_agent
+
     print("🏢 Building Enhanced Multi-Platform Detective Agency Workflow...")
     
     # Create the state graph with enhanced state
@@ -63,9 +76,9 @@ def enhanced_insight_generation_agent(state: MultiPlatformState) -> MultiPlatfor
             if focus_brand in competitive_scores:
                 brand_data = competitive_scores[focus_brand]
                 if brand_data["market_presence"] < 70:
-                    competitive_recommendations.append("Increase market presence through content marketing")
+                    competitive_recommendations.append(_LOW_PRESENCE_REC)
                 if brand_data["engagement_quality"] < 70:
-                    competitive_recommendations.append("Improve content quality to enhance engagement")
+                    competitive_recommendations.append(_LOW_ENGAGEMENT_REC)
     else:
         competitive_insights = []
         competitive_recommendations = []
@@ -139,19 +152,30 @@ def display_multiplatform_summary(state: MultiPlatformState):
     
     enabled_platforms = state.get("enabled_platforms", ["google"])
     raw_results = len(state.get("raw_search_results", []))
-    
-    print(f"📊 Multi-Platform Data Collection:")
-    print(f"   • Platforms analyzed: {', '.join(enabled_platforms)}")
-    print(f"   • Total results processed: {raw_results}")
-    
+
+    # Summary lines accumulate here and flush as one buffered write at the
+    # end - one stdout lock/flush instead of ~25, and no interleaving when
+    # investigations run concurrently
+    lines = [
+        f"📊 Multi-Platform Data Collection:",
+        f"   • Platforms analyzed: {', '.join(enabled_platforms)}",
+        f"   • Total results processed: {raw_results}",
+    ]
+
     # Platform breakdown
     platform_breakdown = {}
     if len(enabled_platforms) > 1:
-        google_results = len([r for r in state.get("raw_search_results", []) if r.get("source") == "google"])
-        youtube_results = len([r for r in state.get("raw_search_results", []) if r.get("source", "").startswith("youtube")])
-        
-        print(f"   • Google results: {google_results}")
-        print(f"   • YouTube results: {youtube_results}")
+        # One Counter pass over the results instead of one comprehension
+        # per platform (youtube_video/youtube_comment fold into "youtube")
+        source_counts = Counter(
+            "youtube" if r.get("source", "").startswith("youtube") else r.get("source")
+            for r in state.get("raw_search_results", [])
+        )
+        google_results = source_counts.get("google", 0)
+        youtube_results = source_counts.get("youtube", 0)
+
+        lines.append(f"   • Google results: {google_results}")
+        lines.append(f"   • YouTube results: {youtube_results}")
         platform_breakdown = {
             "platforms": enabled_platforms,
             "results_count": {
@@ -174,73 +198,75 @@ def display_multiplatform_summary(state: MultiPlatformState):
     # Brand analysis
     brands_found = len(state.get("brand_mentions", {}))
     total_mentions = sum(state.get("brand_mentions", {}).values())
-    print(f"   • Brands identified: {brands_found}")  
-    print(f"   • Total brand mentions: {total_mentions}")
-    
+    lines.append(f"   • Brands identified: {brands_found}")
+    lines.append(f"   • Total brand mentions: {total_mentions}")
+
     # SoV metrics
     sov_metrics = state.get("sov_metrics", {})
     focus_brand = state.get("focus_brand", "atomberg")
     if focus_brand in sov_metrics:
         brand_metrics = sov_metrics[focus_brand]
-        print(f"\n🎯 {focus_brand.capitalize()} Performance:")
-        print(f"   • Overall SoV: {brand_metrics['overall_sov']:.1f}%")
-        print(f"   • Mention Share: {brand_metrics['mention_share']:.1f}%")
-        print(f"   • Engagement Share: {brand_metrics['engagement_share']:.1f}%")
-    
+        lines.append(f"\n🎯 {focus_brand.capitalize()} Performance:")
+        lines.append(f"   • Overall SoV: {brand_metrics['overall_sov']:.1f}%")
+        lines.append(f"   • Mention Share: {brand_metrics['mention_share']:.1f}%")
+        lines.append(f"   • Engagement Share: {brand_metrics['engagement_share']:.1f}%")
+
     # Multi-platform insights
     cross_platform_insights = state.get("cross_platform_insights", [])
     if cross_platform_insights:
-        print(f"\n🌐 Cross-Platform Insights:")
+        lines.append(f"\n🌐 Cross-Platform Insights:")
         for insight in cross_platform_insights[:3]:
-            print(f"   • {insight}")
-    
+            lines.append(f"   • {insight}")
+
     # Regular insights (backward compatibility)
     insights = state.get("quantitative_insights", [])
     if insights:
-        print(f"\n💡 Key Insights:")
+        lines.append(f"\n💡 Key Insights:")
         for insight in insights[:3]:
-            print(f"   • {insight}")
-    
+            lines.append(f"   • {insight}")
+
     # Recommendations
     recommendations = state.get("action_recommendations", [])
     if recommendations:
-        print(f"\n🎯 Recommended Actions:")
+        lines.append(f"\n🎯 Recommended Actions:")
         for rec in recommendations[:3]:
-            print(f"   • {rec}")
-    
-    print(f"\n⏱️ Investigation Phase: {state.get('current_phase', 'Unknown')}")
+            lines.append(f"   • {rec}")
+
+    lines.append(f"\n⏱️ Investigation Phase: {state.get('current_phase', 'Unknown')}")
 
     # Add competitive intelligence summary
     competitive_intelligence = state.get("competitive_intelligence", {})
     if competitive_intelligence and "competitive_scores" in competitive_intelligence:
-        print(f"\n🏆 Competitive Intelligence Analysis:")
-        
+        lines.append(f"\n🏆 Competitive Intelligence Analysis:")
+
         competitive_scores = competitive_intelligence["competitive_scores"]
-        
+
         # Show focus brand's competitive score
         if focus_brand in competitive_scores:
             brand_data = competitive_scores[focus_brand]
             total_score = brand_data["total_score"]
             tier = brand_data["performance_tier"]
             cai = brand_data.get("competitive_advantage_index", 0)
-            
-            print(f"   • {focus_brand.capitalize()} Competitive Score: {total_score:.1f}/100 ({tier})")
-            print(f"   • Competitive Advantage Index: {cai:+.2f}")
-        
+
+            lines.append(f"   • {focus_brand.capitalize()} Competitive Score: {total_score:.1f}/100 ({tier})")
+            lines.append(f"   • Competitive Advantage Index: {cai:+.2f}")
+
         # Show top competitors
-        sorted_competitors = sorted(competitive_scores.items(), 
+        sorted_competitors = sorted(competitive_scores.items(),
                                   key=lambda x: x[1]["total_score"], reverse=True)
-        
-        print(f"   • Market leader: {sorted_competitors[0][0]} ({sorted_competitors[0][1]['total_score']:.1f}/100)")
-        
+
+        lines.append(f"   • Market leader: {sorted_competitors[0][0]} ({sorted_competitors[0][1]['total_score']:.1f}/100)")
+
         # Show market positioning
         market_positioning = competitive_intelligence.get("market_positioning", {})
         if focus_brand in market_positioning:
             position = market_positioning[focus_brand]["position"]
-            print(f"   • {focus_brand.capitalize()} position: {position}")
+            lines.append(f"   • {focus_brand.capitalize()} position: {position}")
 
     else:
-        print(f"\n⚠️ Competitive intelligence not available in final state")
+        lines.append(f"\n⚠️ Competitive intelligence not available in final state")
+
+    print("\n".join(lines))
 
 # Backward compatibility - existing function names still work
 run_complete_investigation = run_multiplatform_investigation  # Alias for compatibility
@@ -3,6 +3,8 @@
 Maintains backward compatibility while adding YouTube intelligence
 """
 
+import time
+from functools import lru_cache
 from typing import TypedDict, List, Dict, Any, Optional
 from datetime import datetime
 
@@ -119,35 +121,59 @@ def create_multiplatform_state(
         influencer_opportunities=[]
     )
 
+# Static per-platform settings; generate_platform_configs copies these and
+# fills in the values that depend on the enabled-platform set
+_PLATFORM_CONFIG_TEMPLATES = {
+    "google": {
+        "human_like_delays": True,
+        "stealth_mode": True
+    },
+    "youtube": {
+        "target_videos": 25,
+        "target_comments_per_video": 20,
+        "include_channel_analysis": True,
+        "max_video_age_days": 365  # Only videos from last year
+    }
+}
+
 def generate_platform_configs(platforms: List[str]) -> Dict[str, Dict]:
     """Generate configuration for each enabled platform"""
-    
-    configs = {}
-    
-    if "google" in platforms:
-        configs["google"] = {
-            "target_results": 50 // len(platforms),  # Distribute results
-            "human_like_delays": True,
-            "stealth_mode": True
-        }
-    
-    if "youtube" in platforms:
-        configs["youtube"] = {
-            "target_videos": 25,
-            "target_comments_per_video": 20,
-            "include_channel_analysis": True,
-            "max_video_age_days": 365  # Only videos from last year
-        }
-    
+
+    configs = {
+        platform: dict(_PLATFORM_CONFIG_TEMPLATES[platform])
+        for platform in platforms if platform in _PLATFORM_CONFIG_TEMPLATES
+    }
+
+    if "google" in configs:
+        configs["google"]["target_results"] = 50 // len(platforms)  # Distribute results
+
     return configs
 
+@lru_cache(maxsize=None)
+def _platform_upper(platform: str) -> str:
+    """Cached uppercase platform label (only a handful of distinct values)"""
+    return platform.upper()
+
+def format_progress_entry(platform: str, message: str) -> str:
+    """🖊️ Format a progress-log line without touching the state"""
+    # time.strftime skips the datetime object allocation - these lines are
+    # emitted for every logged event
+    timestamp = time.strftime('%H:%M:%S')
+    return f"[{timestamp}] 🎬 {_platform_upper(platform)}: {message}"
+
+def format_error_entry(error_msg: str, recovery_msg: str) -> str:
+    """🖊️ Format an error-log line without touching the state"""
+    timestamp = time.strftime('%H:%M:%S')
+    return f"[{timestamp}] ❌ ERROR: {error_msg} | Recovery: {recovery_msg}"
+
 def log_platform_progress(state: MultiPlatformState, platform: str, message: str) -> MultiPlatformState:
-    """📝 Log progress for specific platform"""
-    timestamp = datetime.now().strftime('%H:%M:%S')
-    log_entry = f"[{timestamp}] 🎬 {platform.upper()}: {message}"
-    
-    updated_log = state["investigation_log"] + [log_entry]
-    return {**state, "investigation_log": updated_log}
+    """📝 Log progress for specific platform
+
+    Appends in place: the workflow runs nodes sequentially without
+    checkpointing, so copying the whole state per log line bought nothing
+    """
+    state["investigation_log"].append(format_progress_entry(platform, message))
+    return state
 
 def merge_platform_results(state: MultiPlatformState) -> MultiPlatformState:
     """
@@ -155,16 +181,22 @@ def merge_platform_results(state: MultiPlatformState) -> MultiPlatformState:
     Maintains backward compatibility with existing analyzers
     """
     
+    # Fast path for the common Google-only investigation: nothing to
+    # convert or dedupe, so alias the existing list instead of copying it
+    if not state.get("youtube_results") and not state.get("instagram_results") and not state.get("twitter_results"):
+        state["unified_results"] = state.get("raw_search_results", [])
+        return state
+
     all_results = []
-    
+
     # Add Google results (existing format)
     if state.get("raw_search_results"):
         all_results.extend(state["raw_search_results"])
     
-    # Add YouTube results (converted to unified format)
+    # Add YouTube results (converted lazily - extend consumes the generator
+    # without materializing an intermediate list)
     if state.get("youtube_results"):
-        unified_youtube = convert_youtube_to_unified_format(state["youtube_results"])
-        all_results.extend(unified_youtube)
+        all_results.extend(convert_youtube_to_unified_format(state["youtube_results"]))
     
     # Deduplicate by 'id', keep first occurrence
     seen_ids = set()
@@ -184,24 +216,25 @@ def merge_platform_results(state: MultiPlatformState) -> MultiPlatformState:
     if duplicates_count > 0:
         print(f"🔍 Deduplication removed {duplicates_count} duplicate results.")
     
-    # Update the main results field for backward compatibility
-    return {
-        **state,
-        "raw_search_results": deduped_results,  # Maintains compatibility
-        "unified_results": deduped_results      # New unified field
-    }
+    # Update the main results field for backward compatibility (targeted
+    # key writes - no full-state copy)
+    state["raw_search_results"] = deduped_results  # Maintains compatibility
+    state["unified_results"] = deduped_results     # New unified field
+    return state
+
+def convert_youtube_to_unified_format(youtube_results: List[Dict]):
+    """Convert YouTube results to match Google result format (generator)"""
+
+    watch_url = "https://www.youtube.com/watch?v="
 
-def convert_youtube_to_unified_format(youtube_results: List[Dict]) -> List[Dict]:
-    """Convert YouTube results to match Google result format"""
-    
-    unified = []
-    
     for item in youtube_results:
-        if item.get("type") == "video":
-            unified.append({
-                "id": f"youtube_video_{item['video_id']}",
+        item_type = item.get("type")
+        if item_type == "video":
+            video_id = item["video_id"]
+            yield ({
+                "id": "youtube_video_" + video_id,
                 "title": item["title"],
-                "url": f"https://www.youtube.com/watch?v={item['video_id']}",
+                "url": watch_url + video_id,
                 "snippet": item["description"][:500],
                 "search_query": item.get("search_query", ""),
                 "position": item.get("position", 0),
@@ -213,22 +246,20 @@ def convert_youtube_to_unified_format(youtube_results: List[Dict]) -> List[Dict]
                     "comments": item.get("comment_count", 0)
                 }
             })
-        elif item.get("type") == "comment":
-            unified.append({
-                "id": f"youtube_comment_{item['comment_id']}",
+        elif item_type == "comment":
+            yield ({
+                "id": "youtube_comment_" + item["comment_id"],
                 "title": f"Comment on: {item.get('video_title', 'YouTube Video')}",
-                "url": f"https://www.youtube.com/watch?v={item['video_id']}",
+                "url": watch_url + item["video_id"],
                 "snippet": item["text"][:500],
                 "search_query": item.get("search_query", ""),
                 "position": 0,
-                "timestamp": item["published_at"], 
+                "timestamp": item["published_at"],
                 "source": "youtube_comment",
                 "engagement_data": {
                     "likes": item.get("like_count", 0)
                 }
             })
-    
-    return unified
 
 print("🧠 Enhanced Multi-Platform Detective State Ready!")
 
@@ -236,14 +267,8 @@ def log_error(state: MultiPlatformState, error_msg: str, recovery_msg: str) -> M
     """
     🚨 Log error with recovery action to the investigation state
     """
-    timestamp = datetime.now().strftime('%H:%M:%S')
-    error_entry = f"[{timestamp}] ❌ ERROR: {error_msg} | Recovery: {recovery_msg}"
-    
-    updated_errors = state.get("errors_log", []) + [error_entry]
-    updated_log = state.get("investigation_log", []) + [error_entry]
-    
-    return {
-        **state,
-        "errors_log": updated_errors,
-        "investigation_log": updated_log
-    }
+    error_entry = format_error_entry(error_msg, recovery_msg)
+
+    state.setdefault("errors_log", []).append(error_entry)
+    state.setdefault("investigation_log", []).append(error_entry)
+    return state
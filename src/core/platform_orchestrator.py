@@ -4,24 +4,36 @@ Manages the collection and coordination of data from all platforms
 """
 
 import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from typing import List
 from ..core.detective_state import MultiPlatformState, log_platform_progress, merge_platform_results
-from ..collectors.google_collector import google_search_agent  
+from ..collectors.google_collector import google_search_agent
 from ..collectors.youtube_collector import youtube_intelligence_agent
 
+# Platform dispatch table - fixed at module load, shared by every
+# orchestrator instance
+_PLATFORM_AGENTS = {
+    "google": google_search_agent,
+    "youtube": youtube_intelligence_agent,
+    # Future platforms will be added here
+    # "instagram": instagram_collector_agent,
+    # "twitter": twitter_collector_agent,
+}
+
+# State keys each platform agent owns in its returned state - the merge
+# after a concurrent run copies exactly these back
+_PLATFORM_RESULT_KEYS = {
+    "google": ("raw_search_results", "search_metadata"),
+    "youtube": ("youtube_results", "youtube_metadata", "youtube_channels"),
+}
+
 class PlatformOrchestrator:
     """
     🎬 Coordinates data collection across all enabled platforms
     """
     
     def __init__(self):
-        self.available_platforms = {
-            "google": google_search_agent,
-            "youtube": youtube_intelligence_agent,
-            # Future platforms will be added here
-            # "instagram": instagram_collector_agent,
-            # "twitter": twitter_collector_agent,
-        }
+        self.available_platforms = _PLATFORM_AGENTS
     
     def collect_all_platforms(self, state: MultiPlatformState) -> MultiPlatformState:
         """
@@ -37,38 +49,74 @@ class PlatformOrchestrator:
             f"Starting collection across platforms: {', '.join(enabled_platforms)}"
         )
         
-        # Sequential collection (for now - could be parallelized later)
+        to_run = []
         for platform in enabled_platforms:
-            if platform in self.available_platforms:
+            agent = self.available_platforms.get(platform)
+            if agent is None:
+                print(f"⚠️ Platform '{platform}' not yet implemented")
+            else:
+                to_run.append((platform, agent))
+
+        if len(to_run) > 1:
+            # Platform collectors are independent network-bound agents that
+            # write disjoint result keys, so they run concurrently - wall
+            # time becomes max(platform latencies) instead of their sum.
+            # Each agent gets private log lists; new entries merge afterwards
+            base_log_len = len(state["investigation_log"])
+            base_err_len = len(state["errors_log"])
+
+            def run_platform(agent):
+                local_state = {
+                    **state,
+                    "investigation_log": state["investigation_log"][:],
+                    "errors_log": state["errors_log"][:]
+                }
+                return agent(local_state)
+
+            print(f"\n🔄 Executing {len(to_run)} platform collections in parallel...")
+            with ThreadPoolExecutor(max_workers=len(to_run)) as pool:
+                futures = [(platform, pool.submit(run_platform, agent)) for platform, agent in to_run]
+
+                for platform, future in futures:
+                    try:
+                        platform_state = future.result()
+                    except Exception as e:
+                        error_msg = f"{platform} collection failed: {str(e)}"
+                        print(f"❌ {error_msg}")
+                        state["errors_log"].append(error_msg)
+                        continue
+
+                    for key in _PLATFORM_RESULT_KEYS.get(platform, ()):
+                        if key in platform_state:
+                            state[key] = platform_state[key]
+                    state["investigation_log"].extend(platform_state["investigation_log"][base_log_len:])
+                    state["errors_log"].extend(platform_state["errors_log"][base_err_len:])
+
+                    print(f"✅ {platform} collection completed successfully")
+        else:
+            # Single platform: run in this thread, no state copying needed
+            for platform, platform_agent in to_run:
                 print(f"\n🔄 Executing {platform} collection...")
-                
+
                 try:
-                    # Call the appropriate platform agent
-                    platform_agent = self.available_platforms[platform]
                     state = platform_agent(state)
-                    
+
                     print(f"✅ {platform} collection completed successfully")
-                    
+
                 except Exception as e:
                     error_msg = f"{platform} collection failed: {str(e)}"
                     print(f"❌ {error_msg}")
-                    
-                    state = {
-                        **state,
-                        "errors_log": state["errors_log"] + [error_msg]
-                    }
-            else:
-                print(f"⚠️ Platform '{platform}' not yet implemented")
-        
+
+                    state["errors_log"].append(error_msg)
+
+
         # Merge all platform results into unified format
         state = merge_platform_results(state)
         
         # Update phase
-        state = {
-            **state,
-            "current_phase": "multi_platform_collection_complete"
-        }
-        
+        state["current_phase"] = "multi_platform_collection_complete"
+
+
         state = log_platform_progress(
             state,
             "orchestrator", 